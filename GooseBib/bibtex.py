@@ -6,17 +6,29 @@ For BibTeX files:
 *   Compare.
 """
 import argparse
+import copy
 import difflib
+import hashlib
+import html
 import inspect
 import io
 import os
+import pickle
 import re
 import sys
+import tempfile
 import textwrap
+import threading
+import time
 import warnings
 from collections import defaultdict
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from functools import partial
 from functools import singledispatch
+from itertools import repeat
 from typing import Tuple
 from typing import Union
 
@@ -34,6 +46,38 @@ from . import recognise
 from . import reformat
 from ._version import version
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+_ENTRY_RE = re.compile(r"\@(\w*)\{")
+_FIELD_RE = re.compile(r"([\n\t\ ]*)([\w\_\-]*)([\ ]?=)(.*)")
+_SKIP_ENTRYTYPES = frozenset(["string", "comment", "preamble"])
+_ARXIV_DOI_RE = re.compile(r"(10.48550/arXiv.)([^\s]*)(.*)", re.IGNORECASE)
+_ARXIV_DOI_PREFIX = "10.48550/arXiv."
+_UNDERSCORE_RE = re.compile(r"[\{}]?[\\]+\_[\}]?")
+_BRACED_CHAR_RE = re.compile(r"({)([^}])(})", re.UNICODE)
+_BRACED_RE = re.compile(r"(\{)(.*)(\})")
+_AND_RE = re.compile(r"\ and\ ", re.IGNORECASE)
+_ARXIV_URL_RE = re.compile(r"(http)(s?)(://arxiv.org/abs/)(.*)")
+_ARXIV_VERSION_RE = re.compile(r"v[0-9]+$")
+_IDENTIFIER_SKIP = frozenset(["DISPLAY_ORDER", "INDENT"])
+_ARXIVID_FIELDS = frozenset(["arxivid", "eprint"])
+# (necessary, not sufficient) condition for a match in recognise.doi / recognise.arxivid
+_DOI_CANDIDATE_RE = re.compile(r"doi|/abstract/", re.IGNORECASE)
+_ARXIVID_CANDIDATE_RE = re.compile(r"arxiv|^[0-9]*\.", re.IGNORECASE)
+_NAME_FIELDS = frozenset(["author", "editor"])
+_CLEAN_FIELDS = frozenset(["author", "editor", "title", "journal", "pages", "number", "volume"])
+_CLEVER_MERGE_FIELDS = ("ENTRYTYPE", "author", "editor", "year", "title", "journal", "pages")
+_PARALLEL_MIN_ENTRIES = 500
+
+# memoised (pure) formatters used per entry in clean: fields often repeat between entries
+_autoformat_names = lru_cache(maxsize=8192)(reformat.autoformat_names)
+_number_range = lru_cache(maxsize=8192)(reformat.number_range)
+_protect_math = lru_cache(maxsize=8192)(reformat.protect_math)
+_rm_unicode = lru_cache(maxsize=8192)(reformat.rm_unicode)
+
 
 def yaml_dump(filename, data, force=False):
     r"""
@@ -62,8 +106,43 @@ def yaml_dump(filename, data, force=False):
     if not os.path.isdir(dirname) and len(dirname) > 0:
         os.makedirs(os.path.dirname(filename))
 
+    text = yaml.dump(data, Dumper=YamlDumper, default_flow_style=False)
+
     with open(filename, "w") as file:
-        yaml.dump(data, file)
+        file.write(text)
+
+
+def _iter_display_order(bibtex_str: str, tabsize: int = 2):
+    """
+    Read the order of fields entry-by-entry.
+    Entries are located lazily such that only one entry is considered at a time.
+
+    :param bibtex_str: A BibTeX 'file'.
+    :param tabsize: Replace "\t" by a number of spaces.
+    :return: Generator of (key, list of fields, list of indentations of the fields).
+    """
+
+    matches = _ENTRY_RE.finditer(bibtex_str)
+    following = next(matches, None)
+
+    while following is not None:
+        match = following
+        following = next(matches, None)
+        end = len(bibtex_str) if following is None else following.start()
+
+        if match.group(1).lower() in _SKIP_ENTRYTYPES:
+            continue
+
+        comma = bibtex_str.find(",", match.end(), end)
+
+        if comma < 0:
+            continue
+
+        find = _FIELD_RE.findall(bibtex_str, comma + 1, end)
+        fields = [i[1] for i in find]
+        # the leading whitespace only consists of "\n", "\t", and " ": count without copying
+        indent = [len(i[0]) - i[0].count("\n") + (tabsize - 1) * i[0].count("\t") for i in find]
+        yield bibtex_str[match.end() : comma], fields, indent
 
 
 def read_display_order(bibtex_str: str, tabsize: int = 2) -> (dict, int):
@@ -78,62 +157,99 @@ def read_display_order(bibtex_str: str, tabsize: int = 2) -> (dict, int):
     """
 
     ret = {}
-    indent = []
+    total = 0
+    count = 0
+
+    for key, fields, indent in _iter_display_order(bibtex_str, tabsize):
+        ret[key] = fields
+        total += sum(indent)
+        count += len(indent)
 
-    matches = list(re.finditer(r"(\@\w*\{)", bibtex_str, re.I))
+    if count == 0:
+        indent = 0
+    else:
+        indent = -(-total // count)
 
-    for m in range(len(matches)):
-        i = matches[m].start()
+    return ret, indent
 
-        if m < len(matches) - 1:
-            j = matches[m + 1].start()
-            entry = bibtex_str[i:j]
-        else:
-            entry = bibtex_str[i:]
 
-        components = re.split(r"(.*)(\@\w*\{)", entry)
+@lru_cache(maxsize=4096)
+def _recognise_doi(values: Tuple[str, ...]) -> str:
+    """
+    Memoised :py:func:`GooseBib.recognise.doi`.
 
-        if components[2].lower() in ["@string{", "@comment{", "@preamble{"]:
-            continue
+    :param values: Values to check.
+    :return: The doi or ``None``.
+    """
 
-        key, data = components[3].split(",", 1)
-        find = re.findall(r"([\n\t\ ]*)([\w\_\-]*)([\ ]?=)(.*)", data)
-        ret[key] = [i[1] for i in find]
-        indent += [len("".join(i[0].replace("\t", tabsize * " ").splitlines())) for i in find]
+    if len(values) == 0:
+        return None
 
-    if len(indent) == 0:
-        indent = 0
-    else:
-        indent = int(np.ceil(np.mean(indent)))
+    return recognise.doi(*values)
 
-    return ret, indent
+
+@lru_cache(maxsize=4096)
+def _recognise_arxivid(values: Tuple[str, ...]) -> str:
+    """
+    Memoised :py:func:`GooseBib.recognise.arxivid`.
+
+    :param values: Values to check.
+    :return: The arxivid or ``None``.
+    """
+
+    if len(values) == 0:
+        return None
+
+    return recognise.arxivid(*values)
 
 
-def _get_doi(entry: dict) -> str:
+def _identifier_values(entry: dict) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Values of an entry in which to look for a doi and for an arxivid (in one pass over the entry).
+    Values that can never match any of the patterns of :py:mod:`GooseBib.recognise`
+    (e.g. "year", "pages") are skipped, the order of the other values is preserved.
+
+    :param entry: The bib-entry.
+    :return:
+        Values to check for a doi (all but "arxivid" and "eprint").
+        Values to check for an arxivid (all but "doi").
+    """
+
+    doi = []
+    arxivid = []
+
+    for key, val in entry.items():
+        if key in _IDENTIFIER_SKIP or not isinstance(val, str):
+            continue
+        if key not in _ARXIVID_FIELDS and _DOI_CANDIDATE_RE.search(val):
+            doi.append(val)
+        if key != "doi" and _ARXIVID_CANDIDATE_RE.search(val):
+            arxivid.append(val)
+
+    return tuple(doi), tuple(arxivid)
+
+
+def _get_doi(entry: dict, values: Tuple[str, ...]) -> str:
     """
     Get the doi from an entry. See :py:func:`GooseBib.recognise.doi`.
 
     :param entry: The bib-entry.
+    :param values: Values to check if there is no "doi" field (see :py:func:`_identifier_values`).
     :return: The doi or ``None``.
     """
 
     if "doi" in entry:
         return entry["doi"]
 
-    return recognise.doi(
-        *[
-            val
-            for key, val in entry.items()
-            if key not in ["arxivid", "eprint", "DISPLAY_ORDER", "INDENT"]
-        ]
-    )
+    return _recognise_doi(values)
 
 
-def _get_arxivid(entry: dict) -> str:
+def _get_arxivid(entry: dict, values: Tuple[str, ...]) -> str:
     """
     Get the arxivid from an entry.  See :py:func:`GooseBib.recognise.arxivid`.
 
     :param entry: The bib-entry.
+    :param values: Values to check if there is no arxiv field (see :py:func:`_identifier_values`).
     :return: The arxivid or ``None``.
     """
 
@@ -143,9 +259,7 @@ def _get_arxivid(entry: dict) -> str:
     if "eprint" in entry and entry.get("archiveprefix", "").lower() == "arxiv":
         return entry["eprint"]
 
-    return recognise.arxivid(
-        *[val for key, val in entry.items() if key not in ["doi", "DISPLAY_ORDER", "INDENT"]]
-    )
+    return _recognise_arxivid(values)
 
 
 def get_identifiers(entry: dict) -> dict:
@@ -161,14 +275,15 @@ def get_identifiers(entry: dict) -> dict:
 
     ret = {}
 
-    doi = _get_doi(entry)
-    arxivid = _get_arxivid(entry)
+    doi_values, arxivid_values = _identifier_values(entry)
+    doi = _get_doi(entry, doi_values)
+    arxivid = _get_arxivid(entry, arxivid_values)
 
     if doi is not None:
         if arxivid is None:
-            pattern = re.compile(r"(10.48550/arXiv.)([^\s]*)(.*)", re.IGNORECASE)
-            if re.match(pattern, doi):
-                arxivid = re.split(pattern, doi)[2].strip()
+            match = _ARXIV_DOI_RE.match(doi)
+            if match:
+                arxivid = match.group(2).strip()
 
     if doi is not None:
         ret["doi"] = doi
@@ -205,6 +320,18 @@ class MyBibTexWriter(bibtexparser.bwriter.BibTexWriter):
         return ret.rstrip() + "\n"
 
 
+_PARSER_OPTIONS = (
+    "expect_multiple_parse",
+    "common_strings",
+    "customization",
+    "ignore_nonstandard_types",
+    "homogenize_fields",
+    "interpolate_strings",
+    "encoding",
+    "add_missing_from_crossref",
+)
+
+
 class MyBibTexParser(bibtexparser.bparser.BibTexParser):
     """
     Overload of ``bibtexparser.bparser.BibTexParser`` adding an extra internal field
@@ -237,48 +364,138 @@ class MyBibTexParser(bibtexparser.bparser.BibTexParser):
         self.comments += other.comments
         self.strings.update(other.strings)
 
-        assert self.expect_multiple_parse == other.expect_multiple_parse
-        assert self.common_strings == other.common_strings
-        assert self.customization == other.customization
-        assert self.ignore_nonstandard_types == other.ignore_nonstandard_types
-        assert self.homogenize_fields == other.homogenize_fields
-        assert self.interpolate_strings == other.interpolate_strings
-        assert self.encoding == other.encoding
-        assert self.add_missing_from_crossref == other.add_missing_from_crossref
+        options = _PARSER_OPTIONS
+        assert tuple(getattr(self, i) for i in options) == tuple(getattr(other, i) for i in options)
         return self
 
 
-def parse(bibtex_str: str, aggresive: bool = False) -> str:
+_parse_cache = OrderedDict()
+
+# options of MyBibTexParser to parse as little as possible, see parse
+_PLAIN_OPTIONS = dict(
+    homogenize_fields=False,
+    ignore_nonstandard_types=False,
+    add_missing_from_crossref=False,
+    common_strings=False,
+)
+
+
+def _cache_dir() -> str:
+    """
+    Directory of the persistent cache.
+
+    :return: Path (``$XDG_CACHE_HOME/GooseBib``, by default ``~/.cache/GooseBib``).
+    """
+
+    root = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(root, "GooseBib")
+
+
+def _parse_persistent(
+    key: tuple, bibtex_str: str, **kwargs
+) -> bibtexparser.bibdatabase.BibDatabase:
+    """
+    Parse a BibTeX string using :py:class:`MyBibTexParser`,
+    storing the result on disk (see :py:func:`_cache_dir`).
+    The file is named by a hash of ``key`` and the versions of GooseBib and bibtexparser,
+    such that an update of either invalidates the cache.
+    An unreadable or unwritable cache is simply ignored.
+
+    :param key: Hashable key describing the input and the options.
+    :param bibtex_str: A BibTeX 'file'.
+    :param kwargs: Options passed to :py:class:`MyBibTexParser`.
+    :return: The BibTeX database.
+    """
+
+    dirname = _cache_dir()
+    name = repr((version, bibtexparser.__version__, key)).encode()
+    path = os.path.join(dirname, hashlib.blake2b(name, digest_size=16).hexdigest() + ".pickle")
+
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except Exception:
+        pass
+
+    data = MyBibTexParser(**kwargs).parse(bibtex_str)
+    tmp = None
+
+    try:
+        os.makedirs(dirname, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=dirname, suffix=".tmp", delete=False) as file:
+            tmp = file.name
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        if tmp is not None and os.path.exists(tmp):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    return data
+
+
+def _parse_cached(
+    bibtex_str: str, persistent: bool = False, **kwargs
+) -> bibtexparser.bibdatabase.BibDatabase:
+    """
+    Parse a BibTeX string using :py:class:`MyBibTexParser`.
+    The last few parsed databases are kept in memory, keyed on a hash of the BibTeX string
+    and the options of the parser, such that parsing the same input again is cheap.
+
+    :param bibtex_str: A BibTeX 'file'.
+    :param persistent: Also keep the parsed database on disk (see :py:func:`_parse_persistent`).
+    :param kwargs: Options passed to :py:class:`MyBibTexParser`.
+    :return: The BibTeX database (a copy that can be freely modified).
+    """
+
+    key = (hashlib.blake2b(bibtex_str.encode()).digest(), tuple(sorted(kwargs.items())))
+
+    if key in _parse_cache:
+        _parse_cache.move_to_end(key)
+    else:
+        if persistent:
+            _parse_cache[key] = _parse_persistent(key, bibtex_str, **kwargs)
+        else:
+            _parse_cache[key] = MyBibTexParser(**kwargs).parse(bibtex_str)
+        if len(_parse_cache) > 8:
+            _parse_cache.popitem(last=False)
+
+    return copy.deepcopy(_parse_cache[key])
+
+
+def parse(bibtex_str: str, aggresive: bool = False, use_cache: bool = False) -> str:
     """
     Parse a BibTeX string once.
 
     :param aggresive: Use aggressive interpretation strategy.
+    :param use_cache: Keep the parsed database in a cache on disk to speed-up a next call.
     """
 
     writer = MyBibTexWriter()
 
     if aggresive:
-        parser = MyBibTexParser()
-    else:
-        parser = MyBibTexParser(
-            homogenize_fields=False,
-            ignore_nonstandard_types=False,
-            add_missing_from_crossref=False,
-            common_strings=False,
-        )
+        return writer.write(_parse_cached(bibtex_str, persistent=use_cache))
 
-    return writer.write(parser.parse(bibtex_str))
+    data = _parse_cached(bibtex_str, persistent=use_cache, **_PLAIN_OPTIONS)
+    return writer.write(data)
 
 
 def _subr(pattern, repl, string):
     """
-    Recursive replacement: apply ``re.subn`` until no more replacement is made.
+    Repeated replacement: apply ``pattern.subn`` until no more replacement is made.
+
+    :param pattern: Compiled regular expression.
+    :param repl: Replacement.
+    :param string: String to modify.
+    :return: Modified string.
     """
 
-    string, nsub = re.subn(pattern, repl, string)
+    nsub = 1
 
-    if nsub:
-        return _subr(pattern, repl, string)
+    while nsub:
+        string, nsub = pattern.subn(repl, string)
 
     return string
 
@@ -313,6 +530,9 @@ def selection(use_bibtexparser: bool = False) -> dict:
     )
 
 
+_SELECTION = selection(use_bibtexparser=True)
+
+
 @singledispatch
 def select(
     data: list[dict],
@@ -338,7 +558,7 @@ def select(
     """
 
     if fields is None:
-        fields = selection(use_bibtexparser=True)
+        fields = _SELECTION
 
     if isinstance(fields, list):
         ret = {}
@@ -347,17 +567,17 @@ def select(
                 ret[entry["ENTRYTYPE"]] = ["ID", "ENTRYTYPE", "DISPLAY_ORDER", "INDENT"] + fields
         fields = ret
 
-    for entry in data:
+    fields = {key: frozenset(value) for key, value in fields.items()}
+    with_url = {key: value | {"url"} for key, value in fields.items()}
+
+    for i, entry in enumerate(data):
         select = fields[entry["ENTRYTYPE"]]
 
         if ensure_link:
-            if "url" not in select:
-                if "doi" not in entry and "arxivid" not in entry and "eprint" not in entry:
-                    select.append("url")
+            if "doi" not in entry and "arxivid" not in entry and "eprint" not in entry:
+                select = with_url[entry["ENTRYTYPE"]]
 
-        rm = [key for key in entry if key not in select]
-        for key in rm:
-            del entry[key]
+        entry = data[i] = {key: value for key, value in entry.items() if key in select}
 
         if remove_url:
             if "url" in entry and ("doi" in entry or "arxivid" in entry or "eprint" in entry):
@@ -375,15 +595,13 @@ def _(data, *args, **kwargs) -> bibtexparser.bibdatabase.BibDatabase:
 @select.register(str)
 def _(data, *args, **kwargs) -> str:
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(select(parser.parse(data), *args, **kwargs))
+    return writer.write(select(_parse_cached(data), *args, **kwargs))
 
 
 @select.register(io.IOBase)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(select(parser.parse(data), *args, **kwargs))
+    return writer.write(select(_parse_cached(data.read()), *args, **kwargs))
 
 
 @singledispatch
@@ -397,20 +615,28 @@ def unique_keys(data: list[dict]) -> Tuple[list[dict], dict]:
         A dictionary mapping the new keys to the old keys.
     """
 
-    keys = [entry["ID"] for entry in data]
-    _, iforward = np.unique(keys, return_index=True)
+    first = {}
+    iremove = []
 
-    if iforward.size == len(data):
+    for i, entry in enumerate(data):
+        if first.setdefault(entry["ID"], i) != i:
+            iremove.append(i)
+
+    if len(iremove) == 0:
         return data, {}
 
-    iremove = np.setdiff1d(np.arange(len(data)), iforward)
     renamed = {}
+    existing = set(first)
+    suffix = defaultdict(int)
 
     for i in iremove:
         old_key = data[i]["ID"]
-        for j in range(100):
+        while True:
+            j = suffix[old_key]
+            suffix[old_key] += 1
             new_key = f"{old_key}_{j}"
-            if new_key not in keys:
+            if new_key not in existing:
+                existing.add(new_key)
                 data[i]["ID"] = new_key
                 renamed[new_key] = old_key
                 break
@@ -430,31 +656,93 @@ def _(data, *args, **kwargs) -> Tuple[bibtexparser.bibdatabase.BibDatabase, dict
 @unique_keys.register(str)
 def _(data, *args, **kwargs) -> Tuple[str, dict]:
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    data, renamed = unique_keys(parser.parse(data), *args, **kwargs)
+    data, renamed = unique_keys(_parse_cached(data), *args, **kwargs)
     return writer.write(data), renamed
 
 
+def _complement(index: ArrayLike, n: int) -> ArrayLike:
+    """
+    Indices in ``range(n)`` that are not in ``index``.
+
+    :param index: List of indices.
+    :param n: Number of items.
+    :return: Sorted list of indices.
+    """
+
+    mask = np.ones(n, dtype=bool)
+    mask[index] = False
+    return np.flatnonzero(mask)
+
+
+def _norm(string: str) -> str:
+    """
+    Normalise a field for comparison: lower case without surrounding braces.
+
+    :param string: The field.
+    :return: The normalised field.
+    """
+
+    return string.strip("{").strip("}").lower()
+
+
+def _group(selectors: list) -> Tuple[ArrayLike, ArrayLike]:
+    """
+    Group equal selectors, preserving the order of first occurrence.
+
+    :param selectors: List of hashable selectors (one per entry).
+    :return:
+        Index of the first occurrence of each group (``iforward``).
+        Index of the group of each selector (``ibackward``).
+    """
+
+    buckets = {}
+    iforward = []
+    ibackward = [0] * len(selectors)
+
+    for i, selector in enumerate(selectors):
+        b = buckets.get(selector)
+        if b is None:
+            b = buckets[selector] = len(iforward)
+            iforward.append(i)
+        ibackward[i] = b
+
+    return np.asarray(iforward, dtype=int), np.asarray(ibackward, dtype=int)
+
+
 def _merge(data: list[dict], iforward: ArrayLike, ibackward: ArrayLike, merge: bool) -> list[dict]:
+    """
+    Merge duplicate entries.
+
+    :param data: The BibTeX database.
+    :param iforward: Index of the entry to keep for each group, ascending (see :py:func:`_group`).
+    :param ibackward: Index of the group of each entry.
+    :param merge: Add fields from duplicate entries to the first entry.
+    :return:
+        The BibTeX database.
+        A dictionary mapping the kept keys to the keys of the merged entries.
+    """
+
     if iforward.size == len(data):
         return data, {}
 
     unique = [data[i] for i in iforward]
     keys = [entry["ID"] for entry in unique]
-    merged = {keys[ibackward[i]]: [] for i in np.setdiff1d(np.arange(len(data)), iforward)}
+    merged = {keys[ibackward[i]]: [] for i in _complement(iforward, len(data))}
+
+    normed = {}
 
     for o, n in enumerate(ibackward):
         if unique[n]["ID"] not in merged:
             continue
         merged[unique[n]["ID"]].append(data[o]["ID"])
-        if merge:
+        if merge and o != iforward[n]:
             for key in data[o]:
                 if key not in unique[n]:
                     unique[n][key] = data[o][key]
                 elif not key.isupper():
-                    if latex_to_unicode(
-                        unique[n][key].strip("{").strip("}").lower()
-                    ) != latex_to_unicode(data[o][key].strip("{").strip("}").lower()):
+                    if (n, key) not in normed:
+                        normed[(n, key)] = latex_to_unicode(_norm(unique[n][key]))
+                    if normed[(n, key)] != latex_to_unicode(_norm(data[o][key])):
                         nk = unique[n]["ID"]
                         ok = data[o]["ID"]
                         msg = f'"{nk}:{key}" and "{ok}:{key}" inconsistent'
@@ -462,10 +750,7 @@ def _merge(data: list[dict], iforward: ArrayLike, ibackward: ArrayLike, merge: b
                         msg += f'\n"{data[o][key]}"'
                         warnings.warn(msg, Warning)
 
-    sorter = np.argsort(iforward)
-    data = [unique[i] for i in sorter]
-
-    return data, dict(merged)
+    return unique, dict(merged)
 
 
 @singledispatch
@@ -478,14 +763,13 @@ def unique(data: list[dict], merge: bool = True) -> list[dict]:
     :return: The BibTeX database.
     """
 
-    keys = [entry["ID"] for entry in data]
-    _, iforward, ibackward = np.unique(keys, return_index=True, return_inverse=True)
+    iforward, ibackward = _group([entry["ID"] for entry in data])
 
     if iforward.size == len(data):
         return data
 
     data, merged = _merge(data, iforward, ibackward, merge)
-    merged = ", ".join([f'"{str(i)}"' for i in np.unique([i for i in merged])])
+    merged = ", ".join([f'"{i}"' for i in sorted(set(merged))])
     warnings.warn(f"Merging duplicates, please check:\n{merged}", Warning)
     return data
 
@@ -499,8 +783,7 @@ def _(data, *args, **kwargs) -> bibtexparser.bibdatabase.BibDatabase:
 @unique.register(str)
 def _(data, *args, **kwargs) -> str:
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(unique(parser.parse(data), *args, **kwargs))
+    return writer.write(unique(_parse_cached(data), *args, **kwargs))
 
 
 @singledispatch
@@ -517,86 +800,80 @@ def clever_merge(data: list[dict], merge: bool = True) -> list[dict]:
 
     for i, entry in enumerate(data):
         if "doi" in entry:
-            selector.append("doi: " + entry["doi"])
+            selector.append(("doi", entry["doi"]))
         elif "arxivid" in entry:
-            selector.append("arxivid: " + entry["arxivid"])
+            selector.append(("arxivid", entry["arxivid"]))
         elif "eprint" in entry:
-            selector.append("eprint: " + entry["eprint"])
+            selector.append(("eprint", entry["eprint"]))
         elif "url" in entry:
-            selector.append("url: " + entry["url"])
+            selector.append(("url", entry["url"]))
         elif "title" in entry and "journal" in entry:
-            selector.append(
-                "title: "
-                + entry["title"].lower().strip("{").strip("}")
-                + "journal: "
-                + entry["journal"].lower().strip("{").strip("}")
-            )
+            selector.append(("title", _norm(entry["title"]), _norm(entry["journal"])))
         else:
-            selector.append(f"keep: {i:d}")
+            selector.append(("keep", i))
 
-    _, iforward, ibackward = np.unique(selector, return_index=True, return_inverse=True)
-    data, merged = _merge(data, iforward, ibackward, merge)
+    first, group = _group(selector)
 
     # second pass based on author, year, title, journal
+    # (of the entries as they would be after merging the first pass)
+
+    if merge:
+        view = [{} for _ in first]
+        for entry, n in zip(data, group):
+            for key in _CLEVER_MERGE_FIELDS:
+                if key in entry and key not in view[n]:
+                    view[n][key] = entry[key]
+    else:
+        view = [data[i] for i in first]
 
     selector = []
 
-    for i, entry in enumerate(data):
+    for i, entry in enumerate(view):
         if "editor" in entry and "author" not in entry and entry["ENTRYTYPE"] == "book":
             selector.append(
-                "year: "
-                + entry["year"].lower().strip("{").strip("}")
-                + "title: "
-                + entry["title"].lower().strip("{").strip("}")
-                + "editor: "
-                + entry["editor"].lower().strip("{").strip("}")
+                ("editor", _norm(entry["year"]), _norm(entry["title"]), _norm(entry["editor"]))
             )
         elif "author" not in entry:
-            selector.append(f"keep: {i:d}")
+            selector.append(("keep", i))
         elif "year" not in entry:
-            selector.append(f"keep: {i:d}")
+            selector.append(("keep", i))
         elif "title" not in entry:
-            selector.append(f"keep: {i:d}")
+            selector.append(("keep", i))
         elif "journal" in entry and "pages" in entry:
             selector.append(
-                "year: "
-                + entry["year"].lower().strip("{").strip("}")
-                + "title: "
-                + entry["title"].lower().strip("{").strip("}")
-                + "journal: "
-                + entry["journal"].lower().strip("{").strip("}")
-                + "pages: "
-                + entry["pages"].lower().strip("{").strip("}").replace("--", "-")
+                (
+                    "pages",
+                    _norm(entry["year"]),
+                    _norm(entry["title"]),
+                    _norm(entry["journal"]),
+                    _norm(entry["pages"]).replace("--", "-"),
+                )
             )
         elif "journal" in entry:
             selector.append(
-                "author: "
-                + entry["author"].lower().strip("{").strip("}")
-                + "year: "
-                + entry["year"].lower().strip("{").strip("}")
-                + "title: "
-                + entry["title"].lower().strip("{").strip("}")
-                + "journal: "
-                + entry["journal"].lower().strip("{").strip("}")
+                (
+                    "journal",
+                    _norm(entry["author"]),
+                    _norm(entry["year"]),
+                    _norm(entry["title"]),
+                    _norm(entry["journal"]),
+                )
             )
         else:
             selector.append(
-                "author: "
-                + entry["author"].lower().strip("{").strip("}")
-                + "year: "
-                + entry["year"].lower().strip("{").strip("}")
-                + "title: "
-                + entry["title"].lower().strip("{").strip("}")
+                ("author", _norm(entry["author"]), _norm(entry["year"]), _norm(entry["title"]))
             )
 
-    _, iforward, ibackward = np.unique(selector, return_index=True, return_inverse=True)
-    data, m = _merge(data, iforward, ibackward, merge)
+    _, final = _group(selector)
 
-    for key in m:
-        if key not in merged:
-            merged[key] = m[key]
-        else:
-            merged[key] += m[key]
+    # merge both passes at once:
+    # entries are visited per first-pass group such that fields are taken in the same order
+    # as when merging the first pass before the second
+
+    order = np.lexsort((np.arange(len(data)), first[group]))
+    data = [data[i] for i in order]
+    iforward, ibackward = _group(final[group[order]].tolist())
+    data, merged = _merge(data, iforward, ibackward, merge)
 
     for key in merged:
         if key in merged[key]:
@@ -615,16 +892,14 @@ def _(data: str, *args, **kwargs) -> bibtexparser.bibdatabase.BibDatabase:
 @clever_merge.register(str)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    data, merge = clever_merge(parser.parse(data), *args, **kwargs)
+    data, merge = clever_merge(_parse_cached(data), *args, **kwargs)
     return writer.write(data), merge
 
 
 @clever_merge.register(io.IOBase)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    data, merge = clever_merge(parser.parse(data), *args, **kwargs)
+    data, merge = clever_merge(_parse_cached(data.read()), *args, **kwargs)
     return writer.write(data), merge
 
 
@@ -644,10 +919,9 @@ def manual_merge(data: list[dict], keys: list[Tuple[str, str]]) -> Tuple[list[di
     for key1, key2 in keys:
         assert key1 in ids
         assert key2 in ids
-        i = np.argmax(np.array(ids) == key2)
-        ids[i] = key1
+        ids[ids.index(key2)] = key1
 
-    _, iforward, ibackward = np.unique(ids, return_index=True, return_inverse=True)
+    iforward, ibackward = _group(ids)
     return _merge(data, iforward, ibackward, True)
 
 
@@ -661,19 +935,107 @@ def _(data: str, *args, **kwargs) -> Tuple[bibtexparser.bibdatabase.BibDatabase,
 @manual_merge.register(str)
 def _(data, *args, **kwargs) -> Tuple[str, dict]:
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    data, merge = manual_merge(parser.parse(data), *args, **kwargs)
+    data, merge = manual_merge(_parse_cached(data), *args, **kwargs)
     return writer.write(data), merge
 
 
 @manual_merge.register(io.IOBase)
 def _(data, *args, **kwargs) -> Tuple[str, dict]:
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    data, merge = manual_merge(parser.parse(data), *args, **kwargs)
+    data, merge = manual_merge(_parse_cached(data.read()), *args, **kwargs)
     return writer.write(data), merge
 
 
+def _clean_entry(
+    entry: dict,
+    sep_name: str,
+    sep_journal: str,
+    title: bool,
+    protect_math: bool,
+    rm_unicode: bool,
+    no_abbreviate: list[str],
+) -> dict:
+    """
+    Clean one entry, see :py:func:`clean`.
+    Top-level function such that it can be dispatched to worker processes.
+
+    :param entry: The entry (modified in-place).
+    :return: The entry.
+    """
+
+    # find identifiers
+    iden = get_identifiers(entry)
+    for key in iden:
+        if key not in entry:
+            entry[key] = iden[key]
+
+    # apply arXiv's doi
+    if "arxivid" in entry:
+        if "doi" not in entry:
+            entry["doi"] = "10.48550/arXiv." + entry.pop("arxivid")
+        elif entry["doi"] == "10.48550/arXiv." + entry["arxivid"]:
+            del entry["arxivid"]
+
+    if "eprint" in entry and entry.get("archiveprefix", "").lower() == "arxiv":
+        if "doi" not in entry:
+            entry["doi"] = "10.48550/arXiv." + entry.pop("eprint")
+            del entry["archiveprefix"]
+        elif entry["doi"] == "10.48550/arXiv." + entry["eprint"]:
+            del entry["eprint"]
+            del entry["archiveprefix"]
+
+    # remove title
+    if not title:
+        entry.pop("title", None)
+
+    # format fields (in one pass over the fields that are present)
+    abbreviate = entry["ID"] not in no_abbreviate
+
+    for key in entry.keys() & _CLEAN_FIELDS:
+        value = entry[key]
+
+        if key in _NAME_FIELDS:
+            # fix author abbreviations
+            if abbreviate:
+                value = _autoformat_names(value, sep_name)
+            # convert unicode to LaTeX
+            if rm_unicode:
+                value = _rm_unicode(value)
+        elif key == "title":
+            # protect math-mode
+            if protect_math:
+                value = _protect_math(value)
+            # convert unicode to LaTeX
+            if rm_unicode:
+                value = _rm_unicode(value)
+        elif key == "journal":
+            # abbreviations: change symbol after "."
+            value = value.replace(". ", f".{sep_journal} ")
+            value = value.replace(r".\ ", f".{sep_journal} ")
+        else:
+            # uniform range 000--000
+            value = _number_range(value)
+
+        entry[key] = value
+
+    # fix underscore problems
+    # -
+    if "doi" in entry and "_" in entry["doi"]:
+        entry["doi"] = _UNDERSCORE_RE.sub(r"\\_", entry["doi"])
+    # -
+    if "url" in entry:
+        url = entry["url"]
+        if "_" in url:
+            url = url.replace(r"{\_}", r"\_")
+            url = _UNDERSCORE_RE.sub(r"\\_", url)
+        url = url.replace("{~}", "~").replace(r"\&", "&")
+        if "{" in url:
+            url = _subr(_BRACED_CHAR_RE, r"\2", url)
+        entry["url"] = url
+
+    return entry
+
+
 @singledispatch
 def clean(
     data: list[dict],
@@ -684,6 +1046,7 @@ def clean(
     rm_unicode: bool = True,
     no_abbreviate: list[str] = [],
     select_fields: bool = True,
+    processes: int = 1,
 ) -> list[dict]:
     r"""
     Clean a BibTeX database.
@@ -703,81 +1066,38 @@ def clean(
     :param rm_unicode: Apply fix in :py:func:`GooseBib.reformat.rm_unicode`.
     :param no_abbreviate: List of entries for which to skip author abbreviation.
     :param select_fields: Apply :py:func:`selection` to the output.
+    :param processes:
+        Number of processes over which to distribute the entries.
+        Small databases (up to 500 entries) are always cleaned serially.
+    :return:
+        The BibTeX database.
+        Note that ``data`` is modified in place, but that its entries may be replaced by copies
+        (if ``processes > 1``): always use the returned database.
     """
 
     ignored_authors = []
 
-    for entry in data:
-        # find identifiers
-        iden = get_identifiers(entry)
-        for key in iden:
-            if key not in entry:
-                entry[key] = iden[key]
-
-        # apply arXiv's doi
-        if "arxivid" in entry:
-            if "doi" not in entry:
-                entry["doi"] = "10.48550/arXiv." + entry.pop("arxivid")
-            elif entry["doi"] == "10.48550/arXiv." + entry["arxivid"]:
-                del entry["arxivid"]
-
-        if "eprint" in entry and entry.get("archiveprefix", "").lower() == "arxiv":
-            if "doi" not in entry:
-                entry["doi"] = "10.48550/arXiv." + entry.pop("eprint")
-                del entry["archiveprefix"]
-            elif entry["doi"] == "10.48550/arXiv." + entry["eprint"]:
-                del entry["eprint"]
-                del entry["archiveprefix"]
-
-        # fix author abbreviations
-        if entry["ID"] not in no_abbreviate:
-            for key in ["author", "editor"]:
-                if key in entry:
-                    entry[key] = reformat.autoformat_names(entry[key], sep_name)
-
-        # uniform range 000--000
-        for key in ["pages", "number", "volume"]:
-            if key in entry:
-                entry[key] = reformat.number_range(entry[key])
-
-        # remove title
-        if not title:
-            entry.pop("title", None)
-
-        # protect math-mode
-        if protect_math:
-            for key in ["title"]:
-                if key in entry:
-                    entry[key] = reformat.protect_math(entry[key])
-
-        # convert unicode to LaTeX
-        if rm_unicode:
-            for key in ["author", "editor", "title"]:
-                if key in entry:
-                    entry[key] = reformat.rm_unicode(entry[key])
-
-        # abbreviations: change symbol after "."
-        for key in ["journal"]:
-            if key in entry:
-                entry[key] = entry[key].replace(". ", f".{sep_journal} ")
-                entry[key] = entry[key].replace(r".\ ", f".{sep_journal} ")
-
-        # fix underscore problems
-        # -
-        if "doi" in entry:
-            entry["doi"] = re.sub(r"[\{}]?[\\]+\_[\}]?", r"\\_", entry["doi"])
-        # -
-        if "url" in entry:
-            entry["url"] = entry["url"].replace(r"{\_}", r"\_")
-            entry["url"] = re.sub(r"[\{}]?[\\]+\_[\}]?", r"\\_", entry["url"])
-            entry["url"] = entry["url"].replace("{~}", "~")
-            entry["url"] = entry["url"].replace(r"\&", "&")
-        # -
-        if "url" in entry:
-            entry["url"] = _subr(re.compile(r"({)([^}])(})", re.UNICODE), r"\2", entry["url"])
+    if processes > 1 and len(data) > _PARALLEL_MIN_ENTRIES:
+        worker = partial(
+            _clean_entry,
+            sep_name=sep_name,
+            sep_journal=sep_journal,
+            title=title,
+            protect_math=protect_math,
+            rm_unicode=rm_unicode,
+            no_abbreviate=no_abbreviate,
+        )
+        chunksize = max(1, len(data) // (4 * processes))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            data[:] = executor.map(worker, data, chunksize=chunksize)
+    else:
+        for entry in data:
+            _clean_entry(
+                entry, sep_name, sep_journal, title, protect_math, rm_unicode, no_abbreviate
+            )
 
     if len(ignored_authors) > 0:
-        ignored_authors = "- " + "\n- ".join([str(i) for i in np.unique(ignored_authors)])
+        ignored_authors = "- " + "\n- ".join([str(i) for i in sorted(set(ignored_authors))])
         warnings.warn(f"Protected authors found, please check:\n{ignored_authors}", Warning)
 
     # return selection of fields
@@ -786,7 +1106,7 @@ def clean(
             "``select_fields`` will be deprecated in next major release. "
             "Please call ``selection`` directly."
         )
-        return select(data, fields=selection(use_bibtexparser=True))
+        return select(data, fields=_SELECTION)
     else:
         return data
 
@@ -816,10 +1136,11 @@ def _(data: str, *args, **kwargs) -> str:
     Extra options (on top of those of the ``bibtexparser.bibdatabase.BibDatabase`` overload:
 
     :param sort_entries: Sort entries in output.
+    :param use_cache: Keep the parsed database in a cache on disk to speed-up a next call.
     """
     writer = MyBibTexWriter(sort_entries=kwargs.pop("sort_entries", False))
-    parser = MyBibTexParser()
-    return writer.write(clean(parser.parse(data), *args, **kwargs))
+    data = _parse_cached(data, persistent=kwargs.pop("use_cache", False))
+    return writer.write(clean(data, *args, **kwargs))
 
 
 @clean.register(io.IOBase)
@@ -828,10 +1149,52 @@ def _(data: io.IOBase, *args, **kwargs) -> str:
     Extra options (on top of those of the ``bibtexparser.bibdatabase.BibDatabase`` overload:
 
     :param sort_entries: Sort entries in output.
+    :param use_cache: Keep the parsed database in a cache on disk to speed-up a next call.
     """
     writer = MyBibTexWriter(sort_entries=kwargs.pop("sort_entries", False))
-    parser = MyBibTexParser()
-    return writer.write(clean(parser.parse(data), *args, **kwargs))
+    data = _parse_cached(data.read(), persistent=kwargs.pop("use_cache", False))
+    return writer.write(clean(data, *args, **kwargs))
+
+
+_JOURNAL_TYPES = dict(
+    title="map2name",
+    name="map2name",
+    official="map2name",
+    off="map2name",
+    abbreviation="map2abbreviation",
+    abbr="map2abbreviation",
+    acronym="map2acronym",
+    acro="map2acronym",
+)
+
+
+@lru_cache(maxsize=16)
+def _load_journals(names: Tuple[str, ...]) -> journals.JournalList:
+    """
+    Memoised :py:func:`GooseBib.journals.load`, such that the databases are read only once
+    (e.g. when formatting several files).
+    The order of the names is kept: it determines the priority of the databases.
+
+    :param names: Names of the databases.
+    :return: :py:class:`GooseBib.journals.JournalList` (not to be modified).
+    """
+
+    return journals.load(*names)
+
+
+@lru_cache(maxsize=16)
+def _journal_names(names: Tuple[str, ...]) -> frozenset[str]:
+    """
+    All (lower-case) names and variations in journal database(s).
+
+    :param names: Names of the databases.
+    :return: Set of names.
+    """
+
+    if len(names) == 0:
+        return frozenset()
+
+    return frozenset(str(name).lower() for name in _load_journals(names).names)
 
 
 @singledispatch
@@ -853,18 +1216,14 @@ def abbreviate_journal(
 
     journal_type = journal_type.lower()
     journal_database = [journal_database] if isinstance(journal_database, str) else journal_database
-    revus = [entry["journal"] for entry in data if "journal" in entry]
-
-    db = journals.load(*journal_database)
-    if journal_type in ["title", "name", "official", "off"]:
-        new = db.map2name(revus)
-    elif journal_type in ["abbreviation", "abbr"]:
-        new = db.map2abbreviation(revus)
-    elif journal_type in ["acronym", "acro"]:
-        new = db.map2acronym(revus)
-    else:
+    revus = list(dict.fromkeys(entry["journal"] for entry in data if "journal" in entry))
+
+    if journal_type not in _JOURNAL_TYPES:
         raise OSError(f'Unknown journal type selection "{journal_type}"')
 
+    db = _load_journals(tuple(journal_database))
+    new = getattr(db, _JOURNAL_TYPES[journal_type])(revus)
+
     mapping = {o: n for o, n in zip(revus, new)}
 
     for entry in data:
@@ -888,15 +1247,13 @@ def _(data: str, *args, **kwargs) -> bibtexparser.bibdatabase.BibDatabase:
 @abbreviate_journal.register(str)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(abbreviate_journal(parser.parse(data), *args, **kwargs))
+    return writer.write(abbreviate_journal(_parse_cached(data), *args, **kwargs))
 
 
 @abbreviate_journal.register(io.IOBase)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(abbreviate_journal(parser.parse(data), *args, **kwargs))
+    return writer.write(abbreviate_journal(_parse_cached(data.read()), *args, **kwargs))
 
 
 @singledispatch
@@ -912,53 +1269,30 @@ def format_journal_arxiv(
     :param journal_database: Database(s) with known arXiv variants.
     """
 
-    search = r"(" + re.escape("10.48550/arXiv.") + r")(.*)"
     pattern = ["arxiv", "preprint", "submitted", "in preparation"]
+    known = _journal_names(tuple(journal_database))
 
     for entry in data:
         if "doi" in entry:
-            if not re.match(search, entry["doi"]):
+            if not entry["doi"].startswith(_ARXIV_DOI_PREFIX):
                 continue
 
         if "arxivid" in entry:
             arxivid = entry["arxivid"]
         elif "eprint" in entry and entry.get("archiveprefix", "").lower() == "arxiv":
             arxivid = entry["eprint"]
-        elif re.match(search, entry.get("doi", "None")):
-            arxivid = re.split(search, entry["doi"])
-            if len(arxivid) != 4:
-                continue
-            arxivid = arxivid[2]
+        elif "doi" in entry:
+            arxivid = entry["doi"][len(_ARXIV_DOI_PREFIX) :]
         else:
             continue
 
-        if "journal" not in entry:
-            entry["journal"] = fmt.format(arxivid)
-            entry["ENTRYTYPE"] = "article"
-        else:
-            for i in pattern:
-                if i in entry["journal"].lower():
-                    entry["journal"] = fmt.format(arxivid)
-                    entry["ENTRYTYPE"] = "article"
-                    break
-
-    if len(journal_database) > 0:
-        revus = []
-        for entry in data:
-            if "journal" in entry:
-                revus.append(entry["journal"])
-
-        db = journals.load(*journal_database)
-        new = db.map2name(revus)
-        mapping = {o: n for o, n in zip(revus, new)}
+        if "journal" in entry:
+            journal = entry["journal"].lower()
+            if journal not in known and not any(i in journal for i in pattern):
+                continue
 
-        for entry in data:
-            if "journal" in mapping and "arxivid" in entry:
-                if "doi" in entry:
-                    if not re.match(search, entry["doi"]):
-                        continue
-                entry["journal"] = fmt.format(arxivid)
-                entry["ENTRYTYPE"] = "article"
+        entry["journal"] = fmt.format(arxivid)
+        entry["ENTRYTYPE"] = "article"
 
     return data
 
@@ -972,15 +1306,13 @@ def _(data: str, *args, **kwargs) -> bibtexparser.bibdatabase.BibDatabase:
 @format_journal_arxiv.register(str)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(format_journal_arxiv(parser.parse(data), *args, **kwargs))
+    return writer.write(format_journal_arxiv(_parse_cached(data), *args, **kwargs))
 
 
 @format_journal_arxiv.register(io.IOBase)
 def _(data, *args, **kwargs):
     writer = MyBibTexWriter()
-    parser = MyBibTexParser()
-    return writer.write(format_journal_arxiv(parser.parse(data), *args, **kwargs))
+    return writer.write(format_journal_arxiv(_parse_cached(data.read()), *args, **kwargs))
 
 
 def _GbibClean_parser():
@@ -1027,7 +1359,8 @@ def _GbibClean_parser():
     parser.add_argument(
         "-j",
         "--journal-type",
-        type=str,
+        type=str.lower,
+        choices=list(_JOURNAL_TYPES),
         default="abbreviation",
         help=textwrap.dedent(
             """\
@@ -1179,9 +1512,17 @@ def _GbibClean_parser():
         help="Controls the number of context lines which surround the difference highlights.",
     )
 
+    parser.add_argument(
+        "--diff-max-lines",
+        type=int,
+        default=2000,
+        help="Above this number of lines a (much faster) unified diff is written.",
+    )
+
     parser.add_argument(
         "--diff-type",
-        type=str,
+        type=str.lower,
+        choices=["raw", "plain", "select"],
         default="select",
         help=textwrap.dedent(
             """\
@@ -1199,6 +1540,36 @@ def _GbibClean_parser():
         help='Limit diff to certain keys separated by spaces (e.g. "author,journal,doi").',
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=textwrap.dedent(
+            """\
+            Cache parsed input files on disk (in ``~/.cache/GooseBib``) to speed-up a next run.
+            Nothing is done if input and options are unchanged since a previous run with ``--cache``
+            (unless ``--diff`` or ``--unique`` are used).
+            """
+        ),
+    )
+
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-parse the output to check for dangling {}.",
+    )
+
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help=textwrap.dedent(
+            """\
+            Number of processes over which to distribute the work.
+            With ``--in-place`` files are distributed (default: number of CPUs),
+            otherwise entries are distributed (default: 1).
+            """
+        ),
+    )
+
     parser.add_argument(
         "-f",
         "--force",
@@ -1236,273 +1607,436 @@ def _parse(parser: argparse.ArgumentParser, cli_args: list[str]) -> argparse.Arg
     return parser.parse_args([str(arg) for arg in cli_args])
 
 
-def GbibClean(cli_args: list[str] = None):
+def _read_file(filepath: str) -> str:
     """
-    Command-line tool to clean a BibTeX database, see ``--help``.
+    Read a (BibTeX) file.
+
+    :param filepath: The file.
+    :return: The content of the file.
     """
 
-    parser = _GbibClean_parser()
-    args = _parse(parser, cli_args)
-    renamed = {}
-    merged = {}
-    is_unique = False
+    try:
+        with open(filepath) as file:
+            return file.read()
+    except (FileNotFoundError, IsADirectoryError):
+        raise OSError(f'"{filepath}" does not exist')
 
-    # read input/output filepaths
 
-    if args.in_place:
-        assert args.output is None
-        assert not args.diff
-        assert not args.force
+def _digest(text: str) -> str:
+    """
+    Short hash of a string.
 
-        sourcepaths = args.files
-        outpaths = sourcepaths
-        assert all([os.path.isfile(i) for i in sourcepaths])
+    :param text: The string.
+    :return: Hexadecimal digest.
+    """
 
-    else:
-        if args.output is None:
-            raise OSError("Specify --output STR")
-        if os.path.isdir(args.output):
-            raise OSError("--output cannot be a directory name")
-
-        raw = ""
-        data = []
-        sourcepaths = [None]
-        outpaths = [args.output]
-
-        if len(args.files) == 1:
-            filepath = args.files[0]
-            if not os.path.isfile(filepath):
-                raise OSError(f'"{filepath}" does not exist')
-            with open(filepath) as file:
-                text = file.read()
-                raw += text
-                parsed = MyBibTexParser().parse(text)
-                data = parsed.entries
-        else:
-            for filepath in args.files:
-                if not os.path.isfile(filepath):
-                    raise OSError(f'"{filepath}" does not exist')
-                with open(filepath) as file:
-                    text = file.read()
-                    raw += text
-                    parsed = MyBibTexParser().parse(text)
-                    data += unique(parsed.entries)
-                    data, r = unique_keys(data)
-                    renamed = {**renamed, **r}
-                    is_unique = True
-
-        if not args.force:
-            overwrite = []
-
-            for outpath in outpaths:
-                if os.path.isfile(outpath):
-                    overwrite += [os.path.normpath(outpath)]
-
-            if args.diff:
-                if os.path.isfile(args.diff):
-                    overwrite += [os.path.normpath(args.diff)]
-
-            if args.unique:
-                if os.path.isfile(args.unique):
-                    overwrite += [os.path.normpath(args.unique)]
-
-            if len(overwrite) > 0:
-                files = ", ".join(overwrite)
-                if not click.confirm(f'Overwrite "{files}"?'):
-                    raise OSError("Cancelled")
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
-    # formatting
 
-    for sourcepath, outpath in zip(sourcepaths, outpaths):
-        if sourcepath is not None:
-            with open(sourcepath) as file:
-                raw = file.read()
-                parsed = MyBibTexParser().parse(raw)
-                data = parsed.entries
+def _GbibClean_stamp(args: argparse.Namespace, raw: str) -> str:
+    """
+    Path of the file (in the cache directory) that stores the digest of the output of
+    :py:func:`GbibClean` for a source and set of options.
+
+    :param args: Parsed command-line arguments.
+    :param raw: Source.
+    :return: Path.
+    """
 
-        # basic clean
+    ignore = ["force", "processes"]
+    options = sorted((key, value) for key, value in vars(args).items() if key not in ignore)
+    return os.path.join(_cache_dir(), "GbibClean", _digest(repr((version, options, raw))))
 
-        parsed.comments = []
-        parsed.strings = OrderedDict()
 
-        data = clean(
-            data,
-            sep_name=args.author_sep,
-            sep_journal=args.journal_sep,
-            title=not args.no_title,
-            protect_math=not args.ignore_math,
-            rm_unicode=not args.ignore_unicode,
-            no_abbreviate=args.raw_author if args.raw_author else [],
-            select_fields=False,
+def _GbibClean_uptodate(args: argparse.Namespace, raw: str, outpath: str) -> bool:
+    """
+    Check if the output of :py:func:`GbibClean` is still up-to-date.
+    This is only the case if the source and the options are the same as in a previous run
+    (with ``--cache``), and the output file was not modified since.
+    The check is skipped if ``--diff`` or ``--unique`` output is requested.
+
+    :param args: Parsed command-line arguments.
+    :param raw: Source.
+    :param outpath: Output file.
+    :return: ``True`` if the output file is up-to-date.
+    """
+
+    if not args.cache or args.diff or args.unique:
+        return False
+
+    try:
+        with open(_GbibClean_stamp(args, raw)) as file:
+            stamp = file.read()
+        with open(outpath) as file:
+            return stamp == _digest(file.read())
+    except OSError:
+        return False
+
+
+def _html_diff(
+    old: list[str],
+    new: list[str],
+    numlines: int = 5,
+    context: bool = False,
+    max_lines: int = 2000,
+) -> str:
+    """
+    HTML diff, see ``difflib.HtmlDiff.make_file``.
+    The side-by-side table scales badly with the number of lines:
+    for long files a unified diff is written instead.
+
+    :param old: Lines of the old file.
+    :param new: Lines of the new file.
+    :param numlines: Number of context lines.
+    :param context: Show only contextual differences (otherwise the full files are shown).
+    :param max_lines: Maximum number of lines for which to write the side-by-side diff.
+    :return: HTML file.
+    """
+
+    if max(len(old), len(new)) <= max_lines:
+        return difflib.HtmlDiff(wrapcolumn=100).make_file(
+            old, new, numlines=numlines, context=context
         )
 
-        # reformat arXiv entries
+    if not context:
+        numlines = max(len(old), len(new))
 
-        if args.arxiv:
-            data = format_journal_arxiv(data, args.arxiv)
+    diff = difflib.unified_diff(old, new, n=numlines, lineterm="")
+    diff = "".join([line.rstrip("\n") + "\n" for line in diff])
+    return f"<!DOCTYPE html>\n<html>\n<body>\n<pre>\n{html.escape(diff)}</pre>\n</body>\n</html>\n"
 
-        # abbreviate journals
 
-        data = abbreviate_journal(
+def _diff_prepare(args: argparse.Namespace, raw: str) -> str:
+    """
+    Source-side of the diff of :py:func:`GbibClean`, see ``--diff-type`` and ``--diff-keys``.
+    The source is parsed (at most) once, also when it is limited to certain keys.
+
+    :param args: Parsed command-line arguments.
+    :param raw: Source.
+    :return: Text to compare with.
+    """
+
+    if args.diff_type == "raw":
+        if not args.diff_keys:
+            return raw
+        data = _parse_cached(raw)
+    elif args.diff_type == "plain":
+        try:
+            data = _parse_cached(raw, **_PLAIN_OPTIONS)
+        except:
+            data = _parse_cached(raw)
+            warnings.warn("Light parsing for diff failed", Warning)
+    else:
+        data = select(_parse_cached(raw))
+
+    if args.diff_keys:
+        data = select(
             data,
-            journal_type=args.journal_type,
-            journal_database=args.journals.split(","),
+            fields=args.diff_keys.split(","),
+            ensure_link=False,
+            remove_url=False,
         )
 
-        # merge identical entries
+    return MyBibTexWriter().write(data)
 
-        if not is_unique:
-            data = unique(data)
 
-        # hand merge duplicates
+def _GbibClean_format(
+    args: argparse.Namespace,
+    outpath: str,
+    raw: str,
+    parsed: bibtexparser.bibdatabase.BibDatabase,
+    data: list[dict],
+    renamed: dict,
+    is_unique: bool,
+):
+    """
+    Format and write one output file of :py:func:`GbibClean`.
+
+    :param args: Parsed command-line arguments.
+    :param outpath: Output file.
+    :param raw: Source (to compare with).
+    :param parsed: Parsed source.
+    :param data: Entries to format.
+    :param renamed: Keys that were already renamed (new key: old key).
+    :param is_unique: ``True`` if the entries were already made unique.
+    """
+
+    merged = {}
+
+    # basic clean
+
+    parsed.comments = []
+    parsed.strings = OrderedDict()
+
+    data = clean(
+        data,
+        sep_name=args.author_sep,
+        sep_journal=args.journal_sep,
+        title=not args.no_title,
+        protect_math=not args.ignore_math,
+        rm_unicode=not args.ignore_unicode,
+        no_abbreviate=args.raw_author if args.raw_author else [],
+        select_fields=False,
+        processes=args.processes or 1,
+    )
+
+    # reformat arXiv entries
+
+    if args.arxiv:
+        data = format_journal_arxiv(data, args.arxiv)
+
+    # abbreviate journals
+
+    data = abbreviate_journal(
+        data,
+        journal_type=args.journal_type,
+        journal_database=args.journals.split(","),
+    )
+
+    # merge identical entries
+
+    if not is_unique:
+        data = unique(data)
 
-        if args.merge:
-            data, merged = manual_merge(data, args.merge)
+    # hand merge duplicates
 
-        # clever merge duplicates
+    if args.merge:
+        data, merged = manual_merge(data, args.merge)
 
-        if args.unique:
-            data, m = clever_merge(data)
-            merged = {**merged, **m}
+    # clever merge duplicates
 
-        # select and rename fields
+    if args.unique:
+        data, m = clever_merge(data)
+        merged.update(m)
 
-        fields = selection(use_bibtexparser=True)
+    # select and rename fields
 
-        if args.add_field:
-            for field in args.add_field:
-                if ":" in field:
-                    typename, field = field.split(":")
+    fields = selection(use_bibtexparser=True)
+
+    if args.add_field:
+        for field in args.add_field:
+            if ":" in field:
+                typename, field = field.split(":")
+                fields[typename].append(field)
+            else:
+                for typename in fields:
                     fields[typename].append(field)
-                else:
-                    for typename in fields:
-                        fields[typename].append(field)
-
-        if args.remove_field:
-            for field in args.remove_field:
-                if ":" in field:
-                    typename, field = field.split(":")
+
+    if args.remove_field:
+        for field in args.remove_field:
+            if ":" in field:
+                typename, field = field.split(":")
+                if field in fields[typename]:
+                    fields[typename].remove(field)
+            else:
+                for typename in fields:
                     if field in fields[typename]:
                         fields[typename].remove(field)
-                else:
-                    for typename in fields:
-                        if field in fields[typename]:
-                            fields[typename].remove(field)
 
-        if args.rename_field:
-            for oldfield, newfield in args.rename_field:
-                for typename in fields:
-                    fields[typename].append(newfield)
-                for entry in data:
-                    if oldfield in entry:
-                        entry[newfield] = entry.pop(oldfield)
-
-        data = select(data, fields=fields)
-
-        # rename keys
-
-        if args.rename:
-            keys = [entry["ID"] for entry in data]
-
-            for oldkey, newkey in args.rename:
-                assert oldkey in keys
-                assert newkey not in keys
-                for i in np.argwhere(np.array(keys) == oldkey).ravel():
-                    data[i]["ID"] = newkey
-                    if oldkey in merged:
-                        merged[newkey] = merged.pop(oldkey)
-                    if oldkey in renamed:
-                        renamed[newkey] = renamed.pop(oldkey)
-
-        # write changed keys
-
-        if args.unique:
-            newnames = {k: v for k, v in renamed.items()}
-
-            for key in merged:
-                for i, value in enumerate(merged[key]):
-                    if value in renamed:
-                        merged[key][i] = renamed[value]
-                        renamed.pop(value)
-
-            for key in renamed:
-                if key in merged:
-                    merged[key].append(renamed[key])
-                else:
-                    merged[key] = [renamed[key]]
-
-            for key in merged:
-                merged[key] = list(set(merged[key]))
-                for value in merged[key]:
-                    if value == key:
-                        merged[key].remove(value)
-
-            merged = {key: merged[key] for key in merged if len(merged[key]) > 0}
-
-            keys = [entry["ID"] for entry in data]
-            for i, key in enumerate(keys):
-                if key in newnames:
-                    if newnames[key] not in keys:
-                        data[i]["ID"] = newnames[key]
-                        merged[newnames[key]] = merged.pop(key)
-
-            yaml_dump(args.unique, merged, force=True)
-
-        elif len(renamed) > 0:
-            merged = ", ".join([f'"{i}" -> "{renamed[i]}"' for i in renamed])
-            warnings.warn(f"Renaming conflicts, please check:\n{merged}", Warning)
-
-        # write output
-
-        parsed.entries = data
-        data = MyBibTexWriter(sort_entries=args.sort_entries).write(parsed)
-
-        if data != parse(data):
-            warnings.warn("Re-parsing is failing, there might be dangling {}", Warning)
-
-        if data == raw:
-            return 0
-
-        with open(outpath, "w") as file:
-            file.write(data)
-
-        if args.diff is not None:
-            if args.diff_type.lower() == "raw":
-                simple = raw
-            elif args.diff_type.lower() == "plain":
-                try:
-                    simple = parse(raw)
-                except:
-                    simple = parse(raw, aggresive=True)
-                    warnings.warn("Light parsing for diff failed", Warning)
-            elif args.diff_type.lower() == "select":
-                simple = select(raw)
+    if args.rename_field:
+        for oldfield, newfield in args.rename_field:
+            for typename in fields:
+                fields[typename].append(newfield)
+            for entry in data:
+                if oldfield in entry:
+                    entry[newfield] = entry.pop(oldfield)
+
+    data = select(data, fields=fields)
+
+    # rename keys
+
+    if args.rename:
+        index = {entry["ID"]: i for i, entry in enumerate(data)}
+
+        for oldkey, newkey in args.rename:
+            assert oldkey in index
+            assert newkey not in index
+            i = index.pop(oldkey)
+            index[newkey] = i
+            data[i]["ID"] = newkey
+            if oldkey in merged:
+                merged[newkey] = merged.pop(oldkey)
+            if oldkey in renamed:
+                renamed[newkey] = renamed.pop(oldkey)
+
+    # write changed keys
+
+    if args.unique:
+        newnames = renamed.copy()
+
+        pending = [(key, i, value) for key in merged for i, value in enumerate(merged[key])]
+        pending = [(key, i, value) for key, i, value in pending if value in renamed]
+
+        for key, i, value in pending:
+            merged[key][i] = renamed[value]
+
+        for value in set(value for _, _, value in pending):
+            renamed.pop(value)
+
+        for key in renamed:
+            if key in merged:
+                merged[key].append(renamed[key])
             else:
-                raise OSError("Unknown option for --diff-type")
-
-            if args.diff_keys:
-                simple = select(
-                    simple,
-                    fields=args.diff_keys.split(","),
-                    ensure_link=False,
-                    remove_url=False,
-                )
-                data = select(
-                    data,
-                    fields=args.diff_keys.split(","),
-                    ensure_link=False,
-                    remove_url=False,
-                )
+                merged[key] = [renamed[key]]
+
+        merged = {key: sorted(set(value) - {key}) for key, value in merged.items()}
+        merged = {key: value for key, value in merged.items() if len(value) > 0}
+
+        keys = set(entry["ID"] for entry in data)
+        for entry in data:
+            key = entry["ID"]
+            if key in newnames:
+                if newnames[key] not in keys:
+                    entry["ID"] = newnames[key]
+                    keys.remove(key)
+                    keys.add(newnames[key])
+                    merged[newnames[key]] = merged.pop(key)
+
+        yaml_dump(args.unique, merged, force=True)
+
+    elif len(renamed) > 0:
+        merged = ", ".join([f'"{i}" -> "{renamed[i]}"' for i in renamed])
+        warnings.warn(f"Renaming conflicts, please check:\n{merged}", Warning)
+
+    # write output
+
+    parsed.entries = data
+
+    if args.diff is not None and args.diff_keys:
+        written = copy.deepcopy(parsed)
+
+    data = MyBibTexWriter(sort_entries=args.sort_entries).write(parsed)
+
+    if args.verify and data != parse(data):
+        warnings.warn("Re-parsing is failing, there might be dangling {}", Warning)
+
+    if args.cache:
+        stamp = _GbibClean_stamp(args, raw)
+        try:
+            os.makedirs(os.path.dirname(stamp), exist_ok=True)
+            with open(stamp, "w") as file:
+                file.write(_digest(data))
+        except OSError:
+            pass
+
+    if data == raw:
+        return
+
+    with open(outpath, "w") as file:
+        file.write(data)
+
+    if args.diff is not None:
+        simple = _diff_prepare(args, raw)
 
-            diff = difflib.HtmlDiff(wrapcolumn=100).make_file(
-                simple.splitlines(keepends=True),
-                data.splitlines(keepends=True),
-                numlines=args.diff_numlines,
-                context=args.diff_context,
+        if args.diff_keys:
+            written = select(
+                written,
+                fields=args.diff_keys.split(","),
+                ensure_link=False,
+                remove_url=False,
             )
+            data = MyBibTexWriter(sort_entries=args.sort_entries).write(written)
+
+        diff = _html_diff(
+            simple.splitlines(keepends=True),
+            data.splitlines(keepends=True),
+            numlines=args.diff_numlines,
+            context=args.diff_context,
+            max_lines=args.diff_max_lines,
+        )
+
+        with open(args.diff, "w") as file:
+            file.write(diff)
+
+
+def _GbibClean_inplace(args: argparse.Namespace, filepath: str):
+    """
+    Format one file of :py:func:`GbibClean` in-place.
+
+    :param args: Parsed command-line arguments.
+    :param filepath: The file.
+    """
+
+    raw = _read_file(filepath)
+
+    if _GbibClean_uptodate(args, raw, filepath):
+        return
+
+    parsed = _parse_cached(raw, persistent=args.cache)
+    _GbibClean_format(args, filepath, raw, parsed, parsed.entries, {}, False)
+
 
-            with open(args.diff, "w") as file:
-                file.write(diff)
+def GbibClean(cli_args: list[str] = None):
+    """
+    Command-line tool to clean a BibTeX database, see ``--help``.
+    """
+
+    parser = _GbibClean_parser()
+    args = _parse(parser, cli_args)
+    renamed = {}
+    is_unique = False
+
+    # format files in-place: files are independent, format them in parallel
+    # (unless they all write to the same --unique file)
+
+    if args.in_place:
+        assert args.output is None
+        assert not args.diff
+        assert not args.force
+        assert all([os.path.isfile(i) for i in args.files])
+
+        if len(args.files) == 1 or args.unique or args.processes == 1:
+            for filepath in args.files:
+                _GbibClean_inplace(args, filepath)
+        else:
+            max_workers = args.processes
+            args.processes = 1
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_GbibClean_inplace, repeat(args), args.files))
+
+        return
+
+    # read input/output filepaths
+
+    if args.output is None:
+        raise OSError("Specify --output STR")
+    if os.path.isdir(args.output):
+        raise OSError("--output cannot be a directory name")
+
+    texts = [_read_file(filepath) for filepath in args.files]
+    raw = "".join(texts)
+
+    if _GbibClean_uptodate(args, raw, args.output):
+        return
+
+    data = []
+
+    if len(texts) == 1:
+        parsed = _parse_cached(raw, persistent=args.cache)
+        data = parsed.entries
+    else:
+        for text in texts:
+            parsed = _parse_cached(text, persistent=args.cache)
+            data += unique(parsed.entries)
+            data, r = unique_keys(data)
+            renamed.update(r)
+            is_unique = True
+
+    if not args.force:
+        overwrite = []
+
+        for filepath in [args.output, args.diff, args.unique]:
+            if filepath and os.path.lexists(filepath):
+                overwrite += [os.path.normpath(filepath)]
+
+        if len(overwrite) > 0:
+            files = ", ".join(overwrite)
+            if not click.confirm(f'Overwrite "{files}"?'):
+                raise OSError("Cancelled")
+
+    # formatting
+
+    _GbibClean_format(args, args.output, raw, parsed, data, renamed, is_unique)
 
 
 def GbibShowAuthorRename():
@@ -1526,37 +2060,34 @@ def GbibShowAuthorRename():
 
     assert all([os.path.isfile(i) for i in args.files])
 
-    source = ""
-
-    for filepath in args.files:
-        with open(filepath) as file:
-            source += file.read()
-
+    source = "".join([_read_file(filepath) for filepath in args.files])
     parser = MyBibTexParser()
 
     data = parser.parse(source)
-    old = []
-    new = []
+    renamed = {}
 
     for entry in data.entries:
         for key in ["author", "editor"]:
             if key in entry:
-                names = re.split(r"\ and\ ", entry[key].replace("\n", " "), flags=re.IGNORECASE)
-                old += names
-                if not re.match(r"(\{)(.*)(\})", entry[key]):
-                    names = bibtexparser.customization.getnames(names)
-                new += [reformat.abbreviate_firstname(i, args.author_sep) for i in names]
-
-    _, index = np.unique(old, return_index=True)
-    old = [old[i] for i in index]
-    new = [new[i] for i in index]
+                names = _AND_RE.split(entry[key].replace("\n", " "))
+                names = [name for name in dict.fromkeys(names) if name not in renamed]
+                if len(names) == 0:
+                    continue
+                split = names
+                if not _BRACED_RE.match(entry[key]):
+                    split = bibtexparser.customization.getnames(names)
+                for name, part in zip(names, split):
+                    renamed[name] = reformat.abbreviate_firstname(part, args.author_sep)
+
+    old = sorted(renamed)
+    new = [renamed[i] for i in old]
 
     if args.all:
         opts = dict(context=False, numlines=1)
     else:
         opts = dict(context=True, numlines=0)
 
-    diff = difflib.HtmlDiff(wrapcolumn=100).make_file(old, new, **opts)
+    diff = _html_diff(old, new, **opts)
 
     if args.output:
         with open(args.output, "w") as file:
@@ -1565,24 +2096,56 @@ def GbibShowAuthorRename():
         print(diff)
 
 
+_ARXIV_ID_BATCH = 100
+_ARXIV_DELAY = 3.0
+_arxiv_lock = threading.Lock()
+_arxiv_last = 0.0
+
+
+def _arxiv_search(query: dict) -> list:
+    """
+    Query arXiv.
+    Queries are started at most once every ``_ARXIV_DELAY`` seconds (also across threads),
+    to respect the rate limit of the arXiv API.
+
+    :param query: Keyword arguments of ``arxiv.Search``.
+    :return: List of results.
+    """
+
+    global _arxiv_last
+
+    with _arxiv_lock:
+        wait = _arxiv_last + _ARXIV_DELAY - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _arxiv_last = time.monotonic()
+
+    return list(arxiv.Search(**query).results())
+
+
 @singledispatch
 def dbsearch_arxiv(
     data: list[dict],
     silent: bool = False,
+    max_workers: int = 4,
 ) -> dict:
     """
     Check online databases (can be slow!).
 
     :param silent: Hide status bar.
+    :param max_workers: Maximal number of simultaneous queries.
     :return: Dictionary with discovered items.
     """
 
     output = defaultdict(lambda: defaultdict(list))
+    idens = [(entry["ID"], get_identifiers(entry)) for entry in data]
 
     # find arxivid based on journal doi
 
-    for entry in tqdm.tqdm(data, disable=silent):
-        iden = get_identifiers(entry)
+    keys = []
+    queries = []
+
+    for key, iden in idens:
         if "arxivid" in iden:
             continue
         if "eprint" in iden and iden.get("archiveprefix", "").lower() == "arxiv":
@@ -1590,26 +2153,50 @@ def dbsearch_arxiv(
         if "doi" not in iden:
             continue
         doi = iden["doi"]
-        ret = []
-        for result in arxiv.Search(query=f'"{doi}"').results():
-            ret.append(re.sub(r"(http)(s?)(://arxiv.org/abs/)(.*)", r"\4", result.entry_id))
-        for i in ret:
-            output[entry["ID"]]["arxivid"].append(i)
+        keys.append(key)
+        queries.append(dict(query=f'"{doi}"'))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_arxiv_search, queries)
+        results = tqdm.tqdm(results, total=len(queries), disable=silent)
+        for key, res in zip(keys, results):
+            for result in res:
+                output[key]["arxivid"].append(_ARXIV_URL_RE.sub(r"\4", result.entry_id))
 
     # arXiv preprint: check if journal id is present
-    # possible optimisation: can be made faster to bluntly skip all entries that have a doi
+    # (query in batches of ids, match results on the id without version)
 
-    for entry in tqdm.tqdm(data, disable=silent):
-        iden = get_identifiers(entry)
+    arxivids = []
+    entries = []
+
+    for key, iden in idens:
         if "arxivid" not in iden:
             continue
-        ret = []
-        for result in arxiv.Search(id_list=[iden["arxivid"]]).results():
-            ret.append(result.doi)
-        if "doi" in iden:
-            ret = [i for i in ret if i != iden["doi"]]
-        for i in ret:
-            output[entry["ID"]]["doi"].append(i)
+        arxivid = iden["arxivid"]
+        if arxivid not in arxivids:
+            arxivids.append(arxivid)
+        entries.append((key, _ARXIV_VERSION_RE.sub("", arxivid), iden.get("doi", None)))
+
+    queries = []
+    found = defaultdict(list)
+
+    for i in range(0, len(arxivids), _ARXIV_ID_BATCH):
+        id_list = arxivids[i : i + _ARXIV_ID_BATCH]
+        queries.append(dict(id_list=id_list, max_results=len(id_list)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_arxiv_search, queries)
+        results = tqdm.tqdm(results, total=len(queries), disable=silent)
+        for res in results:
+            for result in res:
+                arxivid = _ARXIV_VERSION_RE.sub("", _ARXIV_URL_RE.sub(r"\4", result.entry_id))
+                if result.doi not in found[arxivid]:
+                    found[arxivid].append(result.doi)
+
+    for key, arxivid, doi in entries:
+        for result in found[arxivid]:
+            if doi is None or result != doi:
+                output[key]["doi"].append(result)
 
     for key in output:
         output[key] = dict(output[key])
@@ -1672,6 +2259,12 @@ def _GbibDiscover_parser():
         help="Run without status bars.",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache parsed input files on disk (in ``~/.cache/GooseBib``) to speed-up a next run.",
+    )
+
     parser.add_argument(
         "-v",
         "--version",
@@ -1697,17 +2290,8 @@ def GbibDiscover():
     parser = _GbibDiscover_parser()
     args = parser.parse_args()
 
-    source = ""
-
-    for filepath in args.files:
-        if not os.path.isfile(filepath):
-            raise OSError(f'"{filepath}" does not exist')
-        with open(filepath) as file:
-            source += file.read()
-
-    parser = MyBibTexParser()
-
-    data = parser.parse(source)
+    source = "".join([_read_file(filepath) for filepath in args.files])
+    data = _parse_cached(source, persistent=args.cache)
     output = {}
 
     if args.arxiv:
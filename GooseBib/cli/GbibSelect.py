@@ -33,14 +33,14 @@ def Error(msg, exit_code=1):
 
 # ===================================== EXTRACT CITATION KEYS ======================================
 
+_CITE_RE = re.compile(r"([pt])?(\[.*\]\[.*\])?(\{[a-zA-Z0-9\,\-\ ]*\})")
+
 
 def tex2cite(tex):
     # extract keys from "cite"
     def extract(s):
         try:
-            return list(
-                re.split(r"([pt])?(\[.*\]\[.*\])?(\{[a-zA-Z0-9\,\-\ ]*\})", s)[3][1:-1].split(",")
-            )
+            return list(_CITE_RE.split(s)[3][1:-1].split(","))
         except:
             print("Error in interpreting\n {0} ...").format(s[:100])
 
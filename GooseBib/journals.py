@@ -32,6 +32,8 @@ import numpy as np
 import yaml
 from numpy.typing import ArrayLike
 
+_YAML_EXT_RE = re.compile(r"(\.y)([a]?)(ml)")
+
 
 def get_configdir() -> str:
     """
@@ -1309,7 +1311,7 @@ def _get_yaml_files(dirname: str) -> list[str]:
     """
 
     ret = [f for f in os.listdir(dirname)]
-    return [f for f in ret if re.match(r"(\.y)([a]?)(ml)", os.path.splitext(f)[1])]
+    return [f for f in ret if _YAML_EXT_RE.match(os.path.splitext(f)[1])]
 
 
 def load(*args: str) -> JournalList:
@@ -1,6 +1,59 @@
 import re
 from functools import singledispatch
 
+_SPACE_RE = re.compile(r"(.*)([\s])(.*)")
+
+_DOI_PATTERNS = [
+    (
+        re.compile(r"(.*)(http)(s?)(://)([^\s]*)(doi.org/)([^\s]*)(.*)", re.IGNORECASE),
+        7,
+    ),
+    (re.compile(r"(.*)(doi/abs/)([^\s]*)(.*)", re.IGNORECASE), 3),
+    (re.compile(r"(.*)(doi)([^0-9]*)([^\s]*)(.*)", re.IGNORECASE), 4),
+    (
+        re.compile(r"(.*)(http)(s?)(://link.aps.org/doi/)([^\s]*)(.*)", re.IGNORECASE),
+        5,
+    ),
+    (
+        re.compile(
+            r"(.*)(http)(s?)(://journals.aps.org/)(.*)(/abstract/)([^\s]*)(.*)", re.IGNORECASE
+        ),
+        7,
+    ),
+    (
+        re.compile(
+            r"(.*)(http)(s?)(://www.annualreviews.org/doi/abs/)([^\s]*)(.*)", re.IGNORECASE
+        ),
+        5,
+    ),
+]
+
+_ARXIVID_PATTERNS = [
+    (
+        re.compile(
+            r"(.*)(http)(s?)(://)([^\s]*)(arxiv.org/abs/)([^\s]*)(.*)",
+            re.IGNORECASE,
+        ),
+        7,
+    ),
+    (re.compile(r"(.*)(arxiv)([^:]*)([:]?)([\s]*)([^\s]*)(.*)", re.IGNORECASE), 6),
+    (
+        re.compile(
+            r"(.*)(arxiv pre)([a-zA-Z]*)([.]?)([:]?)([\s]*)([0-9]*\.[0-9]*[v]?[0-9]*)",
+            re.IGNORECASE,
+        ),
+        7,
+    ),
+    (
+        re.compile(
+            r"(.*)(http)(s?)(://doi.org/10.48550/arXiv.)([^\s]*)(.*)",
+            re.IGNORECASE,
+        ),
+        5,
+    ),
+    (re.compile(r"([0-9]*\.[0-9]*[v]?[0-9]*)", re.IGNORECASE), 1),
+]
+
 
 @singledispatch
 def doi() -> str:
@@ -14,36 +67,12 @@ def doi() -> str:
 
 @doi.register(str)
 def _(*args) -> str:
-    match = [
-        (
-            re.compile(r"(.*)(http)(s?)(://)([^\s]*)(doi.org/)([^\s]*)(.*)", re.IGNORECASE),
-            7,
-        ),
-        (re.compile(r"(.*)(doi/abs/)([^\s]*)(.*)", re.IGNORECASE), 3),
-        (re.compile(r"(.*)(doi)([^0-9]*)([^\s]*)(.*)", re.IGNORECASE), 4),
-        (
-            re.compile(r"(.*)(http)(s?)(://link.aps.org/doi/)([^\s]*)(.*)", re.IGNORECASE),
-            5,
-        ),
-        (
-            re.compile(
-                r"(.*)(http)(s?)(://journals.aps.org/)(.*)(/abstract/)([^\s]*)(.*)", re.IGNORECASE
-            ),
-            7,
-        ),
-        (
-            re.compile(
-                r"(.*)(http)(s?)(://www.annualreviews.org/doi/abs/)([^\s]*)(.*)", re.IGNORECASE
-            ),
-            5,
-        ),
-    ]
-
-    for regex, index in match:
+    for regex, index in _DOI_PATTERNS:
         for arg in args:
-            if re.match(regex, arg):
-                match = re.split(regex, arg)[index].strip()
-                if not re.match(r"(.*)([\s])(.*)", match):
+            match = regex.match(arg)
+            if match:
+                match = match.group(index).strip()
+                if not _SPACE_RE.match(match):
                     if len(match) > 0:
                         return match
 
@@ -71,37 +100,12 @@ def arxivid() -> str:
 
 @arxivid.register(str)
 def _(*args) -> str:
-    match = [
-        (
-            re.compile(
-                r"(.*)(http)(s?)(://)([^\s]*)(arxiv.org/abs/)([^\s]*)(.*)",
-                re.IGNORECASE,
-            ),
-            7,
-        ),
-        (re.compile(r"(.*)(arxiv)([^:]*)([:]?)([\s]*)([^\s]*)(.*)", re.IGNORECASE), 6),
-        (
-            re.compile(
-                r"(.*)(arxiv pre)([a-zA-Z]*)([.]?)([:]?)([\s]*)([0-9]*\.[0-9]*[v]?[0-9]*)",
-                re.IGNORECASE,
-            ),
-            7,
-        ),
-        (
-            re.compile(
-                r"(.*)(http)(s?)(://doi.org/10.48550/arXiv.)([^\s]*)(.*)",
-                re.IGNORECASE,
-            ),
-            5,
-        ),
-        (re.compile(r"([0-9]*\.[0-9]*[v]?[0-9]*)", re.IGNORECASE), 1),
-    ]
-
-    for regex, index in match:
+    for regex, index in _ARXIVID_PATTERNS:
         for arg in args:
-            if re.match(regex, arg):
-                match = re.split(regex, arg)[index].strip()
-                if not re.match(r"(.*)([\s])(.*)", match):
+            match = regex.match(arg)
+            if match:
+                match = match.group(index).strip()
+                if not _SPACE_RE.match(match):
                     if len(match) > 0:
                         return match
 
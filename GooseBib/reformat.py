@@ -2,22 +2,111 @@
 Automatic formatting.
 """
 import re
+from functools import lru_cache
 
 import bibtexparser
 from bibtexparser.latexenc import latex_to_unicode
 
+_BRACED_RE = re.compile(r"(\{)(.*)(\})")
+_AND_RE = re.compile(r"\ and\ ", re.IGNORECASE)
+_WORD_RE = re.compile(r"([^\s]*)(\s+)")
+
+_NUMBER_RANGE = (
+    (re.compile(r"([0-9]*)(-)(-?)([0-9]*)"), r"\1--\4"),
+    (re.compile(r"([0-9]*)(–)(–?)([0-9]*)", re.UNICODE), r"\1--\4"),
+)
+
+# convert:
+# - trailing ".\" to "."
+# - 'illegal' LaTeX that that places the accent on the space
+_FIRSTNAME_CLEAN = (
+    (re.compile(r"^(.*)(\.\\)$"), r"\1."),
+    (re.compile(r"(.*)(\")(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
+    (re.compile(r"(.*)(\')(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
+    (re.compile(r"(.*)(\^)(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
+)
+
+_FIRSTNAME_INITIAL = (
+    (re.compile(r"(.*)(\(.*\))", re.UNICODE), r"\1"),
+    (
+        re.compile(r"([\w][\}]*)([\w0-9\{\}\`\'\"\\\.\^\{]*)", re.UNICODE),
+        r"\1.",
+    ),
+    (re.compile(r"([\w\.][\-]?)([\ ]*)", re.UNICODE), r"\1"),
+)
+
+_MATH = (
+    (re.compile(r"(\{\\\$\})(.*)(\{\\\$\})", re.UNICODE), r"$\2$"),
+    (re.compile(r"(\$\$)(.*)(\$\$)", re.UNICODE), r"$\2$"),
+    (re.compile(r"(\$)(.*)(\{\\{\})(.*)(\$)", re.UNICODE), r"\1\2{\4\5"),
+    (re.compile(r"(\$)(.*)(\{\\}\})(.*)(\$)", re.UNICODE), r"\1\2}\4\5"),
+    (re.compile(r"(\$)(.*)(\{\\_\})(.*)(\$)", re.UNICODE), r"\1\2_\4\5"),
+    (re.compile(r"(\$)(.*)(\{\\^\})(.*)(\$)", re.UNICODE), r"\1\2^\4\5"),
+    (re.compile(r"(\$)(.*)(\\backslash)(.*)(\$)", re.UNICODE), r"\1\2\\\4\5"),
+)
+
+# NB list not exhaustive, please extend!
+_UNICODE = (
+    ("ç", r"\c{c}"),
+    ("è", r"\`{e}"),
+    ("é", r"\'{e}"),
+    ("É", r"\'{E}"),
+    ("ë", r"\"{e}"),
+    ("ô", r"\^{o}"),
+    ("ö", r"\"{o}"),
+    ("ü", r"\"{y}"),
+    ("g̃", r"\~{g}"),
+    ("ñ", r"\~{n}"),
+    ("İ", r"\.{I}"),
+    ("à", r"\'{a}"),
+    ("ă", r"\v{a}"),
+    ("ř", r"\v{r}"),
+    ("–", "--"),
+    ("—", "--"),
+    ("“", "``"),
+    ("”", "''"),
+    ("×", r"$\times$"),
+)
+
+_ACCENTS = (
+    (r"\c{c}", "c"),
+    (r"\`{e}", "e"),
+    (r"\'{e}", "e"),
+    (r"\'{E}", "E"),
+    (r"\"{e}", "e"),
+    (r"\^{o}", "o"),
+    (r"\"{o}", "o"),
+    (r"\"{y}", "y"),
+    (r"\~{g}", "g"),
+    (r"\~{n}", "n"),
+    (r"\.{I}", "I"),
+    (r"\'{a}", "a"),
+    (r"\v{a}", "a"),
+    (r"\v{r}", "r"),
+    (r"{\"{a}}", "a"),
+    (r"{\"{u}}", "u"),
+    (r"{\'{c}}", "c"),
+    (r"{\'{s}}", "s"),
+    (r"{\^{i}}", "i"),
+    (r"{\v{s}}", "s"),
+    (r"{\v{z}}", "z"),
+    (r"\aa", "a"),
+    (r"{\o}", "o"),
+    (r"'", ""),
+    (r" ", ""),
+)
+
 
 def _subr(regex, sub, text):
     """
     Recursive replacement.
     """
 
-    # make substitutions, get the number of substitutions "n"
-    text, n = re.subn(regex, sub, text)
+    # make substitutions until nothing changes anymore
+    text, n = regex.subn(sub, text)
 
-    # continue substituting
-    if n:
-        return _subr(regex, sub, text)
+    while n:
+        text, n = regex.subn(sub, text)
 
     return text
 
@@ -31,14 +120,9 @@ def number_range(string: str) -> str:
     :return: The reformatted string.
     """
 
-    match = [
-        (re.compile(r"([0-9]*)(-)(-?)([0-9]*)"), r"\1--\4"),
-        (re.compile(r"([0-9]*)(–)(–?)([0-9]*)", re.UNICODE), r"\1--\4"),
-    ]
-
-    for regex, sub in match:
-        if re.match(regex, string):
-            string = re.sub(regex, sub, string)
+    for regex, sub in _NUMBER_RANGE:
+        if regex.match(string):
+            string = regex.sub(sub, string)
 
     return string
 
@@ -49,7 +133,7 @@ def remove_wrapping_braces(string: str) -> str:
     :param string: A string.
     :return: The reformatted string.
     """
-    return _subr(r"(\{)(.*)(\})", r"\2", string)
+    return _subr(_BRACED_RE, r"\2", string)
 
 
 def autoformat_names(names: str, sep: str = " ") -> str:
@@ -64,12 +148,13 @@ def autoformat_names(names: str, sep: str = " ") -> str:
     :return: Formatted names.
     """
 
-    ret = re.split(r"\ and\ ", names.replace("\n", " "), flags=re.IGNORECASE)
-    if not re.match(r"(\{)(.*)(\})", names):
+    ret = _AND_RE.split(names.replace("\n", " "))
+    if not _BRACED_RE.match(names):
         ret = bibtexparser.customization.getnames(ret)
     return " and ".join([abbreviate_firstname(i, sep) for i in ret])
 
 
+@lru_cache(maxsize=8192)
 def abbreviate_firstname(name: str, sep: str = " ") -> str:
     """
     Abbreviate first name(s) to initials.
@@ -90,40 +175,18 @@ def abbreviate_firstname(name: str, sep: str = " ") -> str:
     if len(name.split(",")) > 2:
         raise OSError(f'Unable to interpret name "{name}"')
 
-    # convert:
-    # - trailing ".\" to "."
-    # - 'illegal' LaTeX that that places the accent on the space
-
-    match = [
-        (re.compile(r"^(.*)(\.\\)$"), r"\1."),
-        (re.compile(r"(.*)(\")(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
-        (re.compile(r"(.*)(\')(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
-        (re.compile(r"(.*)(\^)(\ )([a-zA-Z])(.*)", re.UNICODE), r"\1\2\4\5"),
-    ]
-
-    for regex, sub in match:
-        if re.match(regex, name):
-            name = re.sub(regex, sub, name)
-
-    # do replacement
-
-    match = [
-        (re.compile(r"(.*)(\(.*\))", re.UNICODE), r"\1"),
-        (
-            re.compile(r"([\w][\}]*)([\w0-9\{\}\`\'\"\\\.\^\{]*)", re.UNICODE),
-            r"\1.",
-        ),
-        (re.compile(r"([\w\.][\-]?)([\ ]*)", re.UNICODE), r"\1"),
-    ]
+    for regex, sub in _FIRSTNAME_CLEAN:
+        if regex.match(name):
+            name = regex.sub(sub, name)
 
     last, first = name.split(",")
     first = latex_to_unicode(first)
     first = first.replace(".", ". ").replace("-", "- ").replace(r"\. ", r"\.") + " "
-    names = [latex_to_unicode(i[0]) for i in re.findall(r"([^\s]*)(\s+)", first)][1:]
+    names = [latex_to_unicode(i[0]) for i in _WORD_RE.findall(first)][1:]
 
     for i in range(len(names)):
-        for regex, sub in match:
-            names[i] = re.sub(regex, sub, names[i])
+        for regex, sub in _FIRSTNAME_INITIAL:
+            names[i] = regex.sub(sub, names[i])
 
     return last + ", " + sep.join([rm_unicode(i) for i in names]).upper()
 
@@ -165,17 +228,7 @@ def protect_math(text: str) -> str:
     if len(text.split(r"{\$}")) < 3:
         return text
 
-    match = [
-        (re.compile(r"(\{\\\$\})(.*)(\{\\\$\})", re.UNICODE), r"$\2$"),
-        (re.compile(r"(\$\$)(.*)(\$\$)", re.UNICODE), r"$\2$"),
-        (re.compile(r"(\$)(.*)(\{\\{\})(.*)(\$)", re.UNICODE), r"\1\2{\4\5"),
-        (re.compile(r"(\$)(.*)(\{\\}\})(.*)(\$)", re.UNICODE), r"\1\2}\4\5"),
-        (re.compile(r"(\$)(.*)(\{\\_\})(.*)(\$)", re.UNICODE), r"\1\2_\4\5"),
-        (re.compile(r"(\$)(.*)(\{\\^\})(.*)(\$)", re.UNICODE), r"\1\2^\4\5"),
-        (re.compile(r"(\$)(.*)(\\backslash)(.*)(\$)", re.UNICODE), r"\1\2\\\4\5"),
-    ]
-
-    for regex, sub in match:
+    for regex, sub in _MATH:
         text = _subr(regex, sub, text)
 
     return text
@@ -189,30 +242,7 @@ def rm_unicode(text: str) -> str:
     :return: Formatted text.
     """
 
-    # NB list not exhaustive, please extend!
-    match = [
-        ("ç", r"\c{c}"),
-        ("è", r"\`{e}"),
-        ("é", r"\'{e}"),
-        ("É", r"\'{E}"),
-        ("ë", r"\"{e}"),
-        ("ô", r"\^{o}"),
-        ("ö", r"\"{o}"),
-        ("ü", r"\"{y}"),
-        ("g̃", r"\~{g}"),
-        ("ñ", r"\~{n}"),
-        ("İ", r"\.{I}"),
-        ("à", r"\'{a}"),
-        ("ă", r"\v{a}"),
-        ("ř", r"\v{r}"),
-        ("–", "--"),
-        ("—", "--"),
-        ("“", "``"),
-        ("”", "''"),
-        ("×", r"$\times$"),
-    ]
-
-    for ex, sub in match:
+    for ex, sub in _UNICODE:
         text = text.replace(ex, sub)
 
     return text
@@ -228,35 +258,7 @@ def rm_accents(text: str) -> str:
 
     text = rm_unicode(text)
 
-    match = [
-        (r"\c{c}", "c"),
-        (r"\`{e}", "e"),
-        (r"\'{e}", "e"),
-        (r"\'{E}", "E"),
-        (r"\"{e}", "e"),
-        (r"\^{o}", "o"),
-        (r"\"{o}", "o"),
-        (r"\"{y}", "y"),
-        (r"\~{g}", "g"),
-        (r"\~{n}", "n"),
-        (r"\.{I}", "I"),
-        (r"\'{a}", "a"),
-        (r"\v{a}", "a"),
-        (r"\v{r}", "r"),
-        (r"{\"{a}}", "a"),
-        (r"{\"{u}}", "u"),
-        (r"{\'{c}}", "c"),
-        (r"{\'{s}}", "s"),
-        (r"{\^{i}}", "i"),
-        (r"{\v{s}}", "s"),
-        (r"{\v{z}}", "z"),
-        (r"\aa", "a"),
-        (r"{\o}", "o"),
-        (r"'", ""),
-        (r" ", ""),
-    ]
-
-    for ex, sub in match:
+    for ex, sub in _ACCENTS:
         text = text.replace(ex, sub)
 
     return text
@@ -1,5 +1,7 @@
 import re
 
+_CITE_RE = re.compile(r"([pt])?(\[.*\]\[.*\])?(\{[a-zA-Z0-9\,\-\ ]*\})")
+
 
 def list_cite(tex):
     r"""
@@ -13,9 +15,7 @@ def list_cite(tex):
     # extract keys from "cite"
     def extract(s):
         try:
-            return list(
-                re.split(r"([pt])?(\[.*\]\[.*\])?(\{[a-zA-Z0-9\,\-\ ]*\})", s)[3][1:-1].split(",")
-            )
+            return list(_CITE_RE.split(s)[3][1:-1].split(","))
         except:
             print("Error in interpreting\n {0} ...").format(s[:100])
 
@@ -4,6 +4,7 @@ import shutil
 import subprocess
 
 import bibtexparser
+import pytest
 import yaml
 
 import GooseBib as gbib
@@ -255,3 +256,89 @@ def test_journalrename():
                     assert str(d[key]) == entry[key]
 
         os.remove(output)
+
+
+def test_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    source = tmp_path / "input.bib"
+    output = tmp_path / "output.bib"
+    shutil.copy2(os.path.join(dirname, "library_mendeley.bib"), source)
+    gbib.bibtex.GbibClean(["--cache", "-f", "-o", str(output), str(source)])
+    expected = output.read_text()
+
+    calls = []
+    format = gbib.bibtex._GbibClean_format
+
+    def counted(*args):
+        calls.append(args)
+        return format(*args)
+
+    monkeypatch.setattr(gbib.bibtex, "_GbibClean_format", counted)
+
+    # same input and options: output is left untouched
+    gbib.bibtex.GbibClean(["--cache", "-f", "-o", str(output), str(source)])
+    assert len(calls) == 0
+    assert output.read_text() == expected
+
+    # output modified since the last run: regenerated
+    output.write_text("modified")
+    gbib.bibtex.GbibClean(["--cache", "-f", "-o", str(output), str(source)])
+    assert len(calls) == 1
+    assert output.read_text() == expected
+
+    # different option: regenerated
+    gbib.bibtex.GbibClean(["--cache", "-f", "--no-title", "-o", str(output), str(source)])
+    assert len(calls) == 2
+    assert "title" not in output.read_text()
+
+    # different input: regenerated
+    with open(source, "a") as file:
+        file.write("\n@article{Extra2024,\ntitle = {Extra},\nyear = {2024}\n}\n")
+    gbib.bibtex.GbibClean(["--cache", "-f", "--no-title", "-o", str(output), str(source)])
+    assert len(calls) == 3
+    assert "Extra2024" in output.read_text()
+
+
+def test_diff_max_lines(tmp_path):
+    source = os.path.join(dirname, "library_mendeley.bib")
+    output = tmp_path / "output.bib"
+    diff = tmp_path / "diff.html"
+
+    gbib.bibtex.GbibClean(["-f", "-o", output, "--diff", diff, source])
+    assert "<table" in diff.read_text()
+
+    gbib.bibtex.GbibClean(["-f", "-o", output, "--diff", diff, "--diff-max-lines", 1, source])
+    text = diff.read_text()
+    assert "<table" not in text
+    assert "<pre>" in text
+    assert "@@" in text
+
+
+def test_choices(tmp_path):
+    parser = gbib.bibtex._GbibClean_parser()
+    source = os.path.join(dirname, "library_mendeley.bib")
+
+    args = parser.parse_args(["--diff-type", "RAW", "--journal-type", "Acro", source])
+    assert args.diff_type == "raw"
+    assert args.journal_type == "acro"
+
+    for option in ["--diff-type", "--journal-type"]:
+        with pytest.raises(SystemExit):
+            gbib.bibtex.GbibClean(["-f", "-o", tmp_path / "output.bib", option, "foo", source])
+        assert not (tmp_path / "output.bib").exists()
+
+
+def test_inplace_processes(tmp_path):
+    source = os.path.join(dirname, "library_mendeley.bib")
+    parallel = [tmp_path / "a.bib", tmp_path / "b.bib"]
+    serial = [tmp_path / "c.bib", tmp_path / "d.bib"]
+
+    for filepath in parallel + serial:
+        shutil.copy2(source, filepath)
+
+    gbib.bibtex.GbibClean(["--in-place", "--processes", 2] + parallel)
+    gbib.bibtex.GbibClean(["--in-place", "--processes", 1] + serial)
+
+    for p, s in zip(parallel, serial):
+        assert p.read_text() == s.read_text()
+        assert p.read_text() != open(source).read()
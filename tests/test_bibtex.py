@@ -1,3 +1,11 @@
+import copy
+import io
+import os
+import pickle
+import time
+import types
+from collections import OrderedDict
+
 import pytest
 
 import GooseBib as bib
@@ -70,3 +78,225 @@ def test_clever_merge():
 
     with pytest.warns(Warning):
         assert bib.bibtex.clever_merge(text)[0] == out
+
+
+def test_read_display_order():
+    text = """
+    @string{foo = {bar}}
+
+    @article{DeGeus2021,
+      author = {De Geus, T.W.J},
+      title = {My new hello world},
+       year = {2021}
+    }
+
+    @comment{ignore = {me}}
+
+    @book{DeGeus2019,
+      year = {2019},
+      editor = {De Geus, T.W.J},
+    }
+    """
+
+    order, indent = bib.bibtex.read_display_order(text)
+
+    assert order == {
+        "DeGeus2021": ["author", "title", "year"],
+        "DeGeus2019": ["year", "editor"],
+    }
+    assert indent == 7
+
+
+def test_select_keeps_fields():
+    data = [
+        {"ID": "a", "ENTRYTYPE": "article", "title": "A", "url": "https://a"},
+        {"ID": "b", "ENTRYTYPE": "article", "title": "B", "url": "https://b", "doi": "10.1/b"},
+    ]
+    fields = {"article": ["ID", "ENTRYTYPE", "title", "doi"]}
+
+    out = bib.bibtex.select(data, fields=fields, remove_url=False)
+
+    assert fields == {"article": ["ID", "ENTRYTYPE", "title", "doi"]}
+    assert out[0] == {"ID": "a", "ENTRYTYPE": "article", "title": "A", "url": "https://a"}
+    assert out[1] == {"ID": "b", "ENTRYTYPE": "article", "title": "B", "doi": "10.1/b"}
+
+
+def test_select_stream():
+    text = """
+    @article{DeGeus2021,
+        author = {De Geus, T.W.J},
+        title = {My new hello world},
+        journal = {Journal of GooseBib},
+        year = {2021},
+        abstract = {Hello}
+    }
+    """
+
+    assert bib.bibtex.select(io.StringIO(text)) == bib.bibtex.select(text)
+
+
+def test_unique_keys():
+    data = [{"ID": "a"}, {"ID": "a_0"}, {"ID": "a"}, {"ID": "b"}, {"ID": "a"}]
+    data, renamed = bib.bibtex.unique_keys(data)
+
+    assert [entry["ID"] for entry in data] == ["a", "a_0", "a_1", "b", "a_2"]
+    assert renamed == {"a_1": "a", "a_2": "a"}
+
+
+def test_group():
+    iforward, ibackward = bib.bibtex._group(["b", "a", "b", "c", "a", "b"])
+
+    # _merge relies on iforward being strictly ascending
+    assert list(iforward) == [0, 1, 3]
+    assert list(ibackward) == [0, 1, 0, 2, 1, 0]
+
+
+def test_format_journal_arxiv():
+    data = [
+        {"ID": "a", "ENTRYTYPE": "misc", "arxivid": "1234.5678", "journal": "arXiv preprint"},
+        {"ID": "b", "ENTRYTYPE": "misc", "arxivid": "1111.2222", "journal": "journal"},
+        {"ID": "c", "ENTRYTYPE": "misc", "arxivid": "3333.4444"},
+    ]
+    data = bib.bibtex.format_journal_arxiv(data, "Preprint: {}")
+
+    assert [entry["journal"] for entry in data] == [
+        "Preprint: 1234.5678",
+        "journal",
+        "Preprint: 3333.4444",
+    ]
+    assert [entry["ENTRYTYPE"] for entry in data] == ["article", "misc", "article"]
+
+
+def test_clean_processes(monkeypatch):
+    data = [
+        {
+            "ID": f"a{i}",
+            "ENTRYTYPE": "article",
+            "author": "de Geus, Thomas Willem Jan and Wyart, Matthieu",
+            "title": "A $\\sigma$ élan",
+            "journal": "Physical Review E",
+            "pages": f"{i}-{i + 10}",
+            "url": "https://arxiv.org/abs/1904.07635",
+        }
+        for i in range(10)
+    ]
+
+    monkeypatch.setattr(bib.bibtex, "_PARALLEL_MIN_ENTRIES", 0)
+    serial = copy.deepcopy(data)
+    parallel = copy.deepcopy(data)
+    serial_out = bib.bibtex.clean(serial, select_fields=False)
+    parallel_out = bib.bibtex.clean(parallel, select_fields=False, processes=2)
+
+    assert parallel_out == serial_out
+    assert parallel == serial
+    assert serial_out is serial
+    assert parallel_out is parallel
+
+
+def test_parse_persistent(monkeypatch, tmp_path):
+    text = """
+    @article{DeGeus2021,
+        author = {De Geus, T.W.J},
+        title = {My new hello world},
+        journal = {Journal of GooseBib},
+        year = {2021}
+    }
+    """
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(bib.bibtex, "_parse_cache", OrderedDict())
+    first = bib.bibtex.parse(text, use_cache=True)
+    assert len(list((tmp_path / "GooseBib").glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed again")
+
+    bib.bibtex._parse_cache.clear()
+    monkeypatch.setattr(bib.bibtex.MyBibTexParser, "parse", fail)
+    assert bib.bibtex.parse(text, use_cache=True) == first
+    assert [path.suffix for path in (tmp_path / "GooseBib").iterdir()] == [".pickle"]
+
+
+def test_parse_persistent_unwritable(monkeypatch, tmp_path):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(bib.bibtex, "_parse_cache", OrderedDict())
+    monkeypatch.setattr(pickle, "dump", fail)
+    bib.bibtex.parse("@article{a, title = {A}}", use_cache=True)
+    assert os.listdir(tmp_path / "GooseBib") == []
+
+
+def test_html_diff():
+    old = ["de Geus, Tom", "Doe, John", "Wyart, Matthieu"]
+    new = ["de Geus, T.", "Doe, J.", "Wyart, M."]
+
+    assert "<table" in bib.bibtex._html_diff(old, new, context=True, numlines=0)
+
+    diff = bib.bibtex._html_diff(old, new + ["<&>"], context=True, numlines=0, max_lines=2)
+    assert "<table" not in diff
+    assert "-Doe, John\n" in diff
+    assert "+Doe, J.\n" in diff
+    assert "+&lt;&amp;&gt;\n" in diff
+
+
+class FakeSearch:
+    """
+    Stand-in for ``arxiv.Search`` recording the time at which results are requested.
+    """
+
+    calls = []
+
+    def __init__(self, query=None, id_list=None, max_results=None):
+        self.query = query
+        self.id_list = id_list
+
+    def results(self):
+        FakeSearch.calls.append((time.monotonic(), self.query, self.id_list))
+        ret = []
+        for i in self.id_list or []:
+            i = i.split("v")[0]
+            url = f"http://arxiv.org/abs/{i}v2"
+            ret.append(types.SimpleNamespace(entry_id=url, doi=f"10.1/{i}"))
+        return ret
+
+
+def test_dbsearch_arxiv_rate_limit(monkeypatch):
+    delay = 0.05
+    monkeypatch.setattr(FakeSearch, "calls", [])
+    monkeypatch.setattr(bib.bibtex, "arxiv", types.SimpleNamespace(Search=FakeSearch))
+    monkeypatch.setattr(bib.bibtex, "_ARXIV_DELAY", delay)
+    monkeypatch.setattr(bib.bibtex, "_arxiv_last", 0.0)
+
+    data = [{"ID": f"a{i}", "ENTRYTYPE": "article", "doi": f"10.1234/{i}"} for i in range(6)]
+    bib.bibtex.dbsearch_arxiv(data, silent=True, max_workers=4)
+
+    assert len(FakeSearch.calls) == 6
+    times = sorted(t for t, _, _ in FakeSearch.calls)
+    assert all(b - a >= 0.9 * delay for a, b in zip(times[:-1], times[1:]))
+
+
+def test_dbsearch_arxiv_batch(monkeypatch):
+    delay = 0.05
+    monkeypatch.setattr(FakeSearch, "calls", [])
+    monkeypatch.setattr(bib.bibtex, "arxiv", types.SimpleNamespace(Search=FakeSearch))
+    monkeypatch.setattr(bib.bibtex, "_ARXIV_DELAY", delay)
+    monkeypatch.setattr(bib.bibtex, "_arxiv_last", 0.0)
+    monkeypatch.setattr(bib.bibtex, "_ARXIV_ID_BATCH", 2)
+
+    data = [{"ID": f"a{i}", "ENTRYTYPE": "article", "arxivid": f"1234.000{i}"} for i in range(4)]
+    data.append({"ID": "b", "ENTRYTYPE": "article", "arxivid": "1234.0000v1"})
+    data.append({"ID": "c", "ENTRYTYPE": "article", "arxivid": "1234.0001"})
+    found = bib.bibtex.dbsearch_arxiv(data, silent=True, max_workers=4)
+
+    id_lists = sorted(id_list for _, _, id_list in FakeSearch.calls)
+    assert id_lists == [["1234.0000", "1234.0001"], ["1234.0000v1"], ["1234.0002", "1234.0003"]]
+    times = sorted(t for t, _, _ in FakeSearch.calls)
+    assert all(b - a >= 0.9 * delay for a, b in zip(times[:-1], times[1:]))
+
+    assert found == {
+        **{f"a{i}": {"doi": [f"10.1/1234.000{i}"]} for i in range(4)},
+        "b": {"doi": ["10.1/1234.0000"]},
+        "c": {"doi": ["10.1/1234.0001"]},
+    }